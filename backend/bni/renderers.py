@@ -0,0 +1,31 @@
+"""
+Custom DRF renderers for the BNI API.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Output matches DRF's JSONRenderer: dates, decimals and other types orjson
+    does not handle natively are passed to DRF's JSONEncoder.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    options = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._encoder.default, option=self.options)
@@ -6,12 +6,20 @@ operations including creation, updates, and deletion.
 """
 import logging
 from typing import Dict, Any, Tuple, Optional
+from django.core.cache import cache
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from chapters.models import Chapter
+from members.models import Member
+from uploads.models import UploadedFileHash
+from bni.services.member_analytics_service import MemberAnalyticsService
 
 logger = logging.getLogger(__name__)
 
+# Member signals invalidate these caches, but only in the process that handled
+# the write when the cache is per-process LocMem, so entries also expire
+MEMBER_CACHE_TIMEOUT = 300  # seconds
+
 
 class ChapterService:
     """Centralized service for chapter operations."""
@@ -175,3 +183,78 @@ class ChapterService:
             QuerySet of all chapters
         """
         return Chapter.objects.all().order_by('name')
+
+    @staticmethod
+    def _active_member_ids_key(chapter_id: int) -> str:
+        return f"chapter:{chapter_id}:active_member_ids"
+
+    @staticmethod
+    def get_active_member_ids(chapter_id: int) -> frozenset:
+        """
+        Get the IDs of a chapter's active members, cached until membership
+        changes or MEMBER_CACHE_TIMEOUT passes.
+
+        Args:
+            chapter_id: Chapter ID
+
+        Returns:
+            Frozenset of active member IDs
+        """
+        return cache.get_or_set(
+            ChapterService._active_member_ids_key(chapter_id),
+            lambda: frozenset(
+                Member.objects.filter(chapter_id=chapter_id, is_active=True)
+                .values_list('id', flat=True)
+            ),
+            MEMBER_CACHE_TIMEOUT
+        )
+
+    @staticmethod
+    def _active_member_names_key(chapter_id: int) -> str:
+        return f"chapter:{chapter_id}:active_member_names"
+
+    @staticmethod
+    def get_active_member_names(chapter_id: int) -> dict:
+        """
+        Get a chapter's active members as an ID -> full name mapping, cached
+        until membership changes or MEMBER_CACHE_TIMEOUT passes.
+
+        Args:
+            chapter_id: Chapter ID
+
+        Returns:
+            Dict mapping active member IDs to full names
+        """
+        def build():
+            return {
+                member_id: f"{first_name} {last_name}"
+                for member_id, first_name, last_name in Member.objects.filter(
+                    chapter_id=chapter_id, is_active=True
+                ).values_list('id', 'first_name', 'last_name')
+            }
+
+        return cache.get_or_set(
+            ChapterService._active_member_names_key(chapter_id), build, MEMBER_CACHE_TIMEOUT
+        )
+
+    @staticmethod
+    def invalidate_member_caches(chapter_id: int) -> None:
+        """Drop the cached active member IDs and names for a chapter."""
+        cache.delete_many([
+            ChapterService._active_member_ids_key(chapter_id),
+            ChapterService._active_member_names_key(chapter_id),
+        ])
+
+    @staticmethod
+    def invalidate_roster_data(chapter_id: int) -> None:
+        """
+        Drop everything derived from a chapter's member roster.
+
+        Clears the member caches and cached member analytics, and deletes the
+        stored upload hashes so re-uploading the same files is reprocessed
+        against the changed roster. Called by the member signals and by bulk
+        writes that bypass them.
+        """
+        ChapterService.invalidate_member_caches(chapter_id)
+        MemberAnalyticsService.invalidate_chapter(chapter_id)
+        UploadedFileHash.objects.filter(monthly_report__chapter_id=chapter_id).delete()
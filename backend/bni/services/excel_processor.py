@@ -7,9 +7,9 @@ from datetime import datetime, date
 import logging
 
 from django.db import transaction
+from django.db.models import Count, Sum
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from openpyxl import load_workbook
 
 from chapters.models import Chapter
 from members.models import Member
@@ -17,9 +17,85 @@ from reports.models import MonthlyReport
 from analytics.models import Referral, OneToOne, TYFCB
 from bni.services.chapter_service import ChapterService
 from bni.services.member_service import MemberService
+from bni.services.member_analytics_service import MemberAnalyticsService
 
 logger = logging.getLogger(__name__)
 
+# SpreadsheetML 2003 tags, as used by the BNI audit and member exports
+SS_NS = '{urn:schemas-microsoft-com:office:spreadsheet}'
+SS_WORKSHEET = f'{SS_NS}Worksheet'
+SS_TABLE = f'{SS_NS}Table'
+SS_ROW = f'{SS_NS}Row'
+SS_CELL = f'{SS_NS}Cell'
+SS_DATA = f'{SS_NS}Data'
+SS_INDEX = f'{SS_NS}Index'
+
+
+def parse_spreadsheet_xml(xml_file_path: str) -> pd.DataFrame:
+    """
+    Parse the first table of an XML spreadsheet (.xls exported as SpreadsheetML).
+
+    Rows are streamed with iterparse and cleared once read, so the whole
+    document tree is never held in memory; parsing stops at the end of the
+    first table. Sparse cells (ss:Index) are padded with empty strings and
+    the first row is used as the header.
+    """
+    import xml.etree.ElementTree as ET
+
+    in_worksheet = in_table = False
+    worksheet_found = table_found = False
+    headers = None
+    data_rows = []
+    max_cols = 0
+
+    with open(xml_file_path, 'rb') as xml_file:
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == SS_WORKSHEET and not worksheet_found:
+                    in_worksheet = worksheet_found = True
+                elif tag == SS_TABLE and in_worksheet and not table_found:
+                    in_table = table_found = True
+                continue
+
+            if tag == SS_ROW and in_table:
+                row_data = []
+                for cell in elem.iter(SS_CELL):
+                    index_attr = cell.get(SS_INDEX)
+                    if index_attr:
+                        # Cell is at specific index (1-based), fill gaps with empty strings
+                        row_data.extend([""] * (int(index_attr) - 1 - len(row_data)))
+                    data_elem = next(cell.iter(SS_DATA), None)
+                    row_data.append((data_elem.text or "") if data_elem is not None else "")
+                elem.clear()
+
+                max_cols = max(max_cols, len(row_data))
+                if headers is None:
+                    headers = row_data
+                else:
+                    data_rows.append(row_data)
+            elif tag == SS_TABLE and in_table:
+                break
+            elif tag == SS_WORKSHEET and in_worksheet:
+                break
+
+    if not worksheet_found:
+        raise ValueError("No worksheet found in XML file")
+    if not table_found:
+        raise ValueError("No table found in worksheet")
+    if not headers:
+        raise ValueError("No headers found in XML file")
+
+    # Pad headers and data rows to match maximum column count
+    headers.extend(f"Column_{i}" for i in range(len(headers), max_cols))
+    for row in data_rows:
+        row.extend([""] * (max_cols - len(row)))
+
+    df = pd.DataFrame(data_rows, columns=headers)
+    logger.info(f"Successfully parsed XML Excel file with {len(df)} rows and {len(df.columns)} columns")
+
+    return df
+
 
 class ExcelProcessorService:
     """Service for processing BNI Excel files and extracting data."""
@@ -140,86 +216,7 @@ class ExcelProcessorService:
         Parse XML-based Excel files (like BNI audit reports) and convert to DataFrame.
         Handles sparse cells (cells with Index attribute indicating position).
         """
-        import xml.etree.ElementTree as ET
-
-        # Parse the XML
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
-
-        # Define namespace
-        ns = {
-            'ss': 'urn:schemas-microsoft-com:office:spreadsheet',
-            'o': 'urn:schemas-microsoft-com:office:office',
-            'x': 'urn:schemas-microsoft-com:office:excel',
-            'html': 'http://www.w3.org/TR/REC-html40'
-        }
-
-        # Find the worksheet
-        worksheet = root.find('.//ss:Worksheet', ns)
-        if worksheet is None:
-            raise ValueError("No worksheet found in XML file")
-
-        # Find the table
-        table = worksheet.find('.//ss:Table', ns)
-        if table is None:
-            raise ValueError("No table found in worksheet")
-
-        # Extract data from rows
-        data_rows = []
-        headers = []
-        max_cols = 0
-
-        rows = table.findall('.//ss:Row', ns)
-        for i, row in enumerate(rows):
-            cells = row.findall('.//ss:Cell', ns)
-            row_data = []
-            col_index = 0
-
-            for cell in cells:
-                # Check if cell has an Index attribute (sparse cells)
-                index_attr = cell.get(f'{{{ns["ss"]}}}Index')
-                if index_attr:
-                    # Cell is at specific index (1-based), fill gaps with empty strings
-                    target_index = int(index_attr) - 1
-                    while col_index < target_index:
-                        row_data.append("")
-                        col_index += 1
-
-                # Extract cell value
-                data_elem = cell.find('.//ss:Data', ns)
-                if data_elem is not None:
-                    cell_value = data_elem.text if data_elem.text else ""
-                else:
-                    cell_value = ""
-                row_data.append(cell_value)
-                col_index += 1
-
-            # Track maximum column count
-            max_cols = max(max_cols, len(row_data))
-
-            if i == 0:
-                # First row is headers
-                headers = row_data
-            else:
-                # Data rows
-                data_rows.append(row_data)
-
-        # Create DataFrame
-        if not headers:
-            raise ValueError("No headers found in XML file")
-
-        # Pad headers and data rows to match maximum column count
-        while len(headers) < max_cols:
-            headers.append(f"Column_{len(headers)}")
-
-        for row in data_rows:
-            while len(row) < max_cols:
-                row.append("")
-
-        df = pd.DataFrame(data_rows, columns=headers)
-        logger.info(f"Successfully parsed XML Excel file with {len(df)} rows and {len(df.columns)} columns")
-
-        return df
+        return parse_spreadsheet_xml(xml_file_path)
     
     def _get_members_lookup(self) -> Dict[str, Member]:
         """Create a lookup dictionary for chapter members by normalized name."""
@@ -341,18 +338,20 @@ class ExcelProcessorService:
                 self.errors.append(f"Row {idx + 1}: {str(e)}")
                 continue
 
-        # Bulk insert all objects
+        # Bulk insert all objects. Referral, OneToOne and TYFCB have no unique
+        # constraints, so ignore_conflicts drops nothing: re-processing the same
+        # file inserts its rows again
         with transaction.atomic():
             if referrals_to_create:
-                Referral.objects.bulk_create(referrals_to_create, ignore_conflicts=True)
+                Referral.objects.bulk_create(referrals_to_create, ignore_conflicts=True, batch_size=1000)
                 results['referrals_created'] = len(referrals_to_create)
 
             if one_to_ones_to_create:
-                OneToOne.objects.bulk_create(one_to_ones_to_create, ignore_conflicts=True)
+                OneToOne.objects.bulk_create(one_to_ones_to_create, ignore_conflicts=True, batch_size=1000)
                 results['one_to_ones_created'] = len(one_to_ones_to_create)
 
             if tyfcbs_to_create:
-                TYFCB.objects.bulk_create(tyfcbs_to_create, ignore_conflicts=True)
+                TYFCB.objects.bulk_create(tyfcbs_to_create, ignore_conflicts=True, batch_size=1000)
                 results['tyfcbs_created'] = len(tyfcbs_to_create)
 
         # Add success flag and error message if any
@@ -699,6 +698,10 @@ class ExcelProcessorService:
                 monthly_report.save()
                 self._generate_and_cache_matrices(monthly_report)
 
+                # Drop cached member analytics once the new data is committed
+                chapter_id = self.chapter.id
+                transaction.on_commit(lambda: MemberAnalyticsService.invalidate_chapter(chapter_id))
+
                 return {
                     'success': True,
                     'monthly_report_id': monthly_report.id,
@@ -723,9 +726,6 @@ class ExcelProcessorService:
         import tempfile
         import os
 
-        members_created = 0
-        members_updated = 0
-
         # Read member names file
         if hasattr(member_names_file, 'temporary_file_path'):
             member_names_path = member_names_file.temporary_file_path()
@@ -741,43 +741,56 @@ class ExcelProcessorService:
                 finally:
                     os.unlink(temp_file.name)
 
-        # Process members
-        for index, row in member_df.iterrows():
-            try:
-                if 'First Name' in row and 'Last Name' in row:
-                    first_name = row['First Name']
-                    last_name = row['Last Name']
-                else:
-                    continue
+        return self._sync_members(member_df)
 
-                if pd.isna(first_name) or pd.isna(last_name):
-                    continue
+    def _sync_members(self, member_df: pd.DataFrame) -> Dict:
+        """
+        Create the chapter members listed in a member names DataFrame.
 
-                first_name_str = str(first_name).strip()
-                last_name_str = str(last_name).strip()
+        Existing normalized names are loaded once and new members are inserted
+        with a single bulk_create, instead of a get_or_create per row. Existing
+        members are left unchanged and counted as updated.
+        """
+        if 'First Name' not in member_df.columns or 'Last Name' not in member_df.columns:
+            return {'created': 0, 'updated': 0}
 
-                if not first_name_str or not last_name_str:
-                    continue
+        known_names = set(
+            Member.objects.filter(chapter=self.chapter).values_list('normalized_name', flat=True)
+        )
+        members_to_create = []
+        members_updated = 0
 
-                member, created = MemberService.get_or_create_member(
-                    chapter=self.chapter,
-                    first_name=first_name_str,
-                    last_name=last_name_str,
-                    business_name='',
-                    classification='',
-                    is_active=True
-                )
+        for first_name, last_name in zip(member_df['First Name'], member_df['Last Name']):
+            if pd.isna(first_name) or pd.isna(last_name):
+                continue
 
-                if created:
-                    members_created += 1
-                else:
-                    members_updated += 1
+            first_name_str = str(first_name).strip()
+            last_name_str = str(last_name).strip()
 
-            except Exception as e:
-                logger.error(f"Error processing member row {index}: {str(e)}")
-                self.warnings.append(f"Error processing member row {index}: {str(e)}")
+            if not first_name_str or not last_name_str:
+                continue
+
+            normalized_name = Member.normalize_name(f"{first_name_str} {last_name_str}")
+            if normalized_name in known_names:
+                members_updated += 1
+                continue
 
-        return {'created': members_created, 'updated': members_updated}
+            known_names.add(normalized_name)
+            members_to_create.append(Member(
+                chapter=self.chapter,
+                first_name=first_name_str,
+                last_name=last_name_str,
+                normalized_name=normalized_name,
+                is_active=True,
+            ))
+
+        if members_to_create:
+            Member.objects.bulk_create(members_to_create, batch_size=1000)
+            # bulk_create skips post_save, so do the signal's invalidation here
+            ChapterService.invalidate_roster_data(self.chapter.id)
+            logger.info("Created %d members in %s", len(members_to_create), self.chapter.name)
+
+        return {'created': len(members_to_create), 'updated': members_updated}
 
     def _process_single_slip_file(self, slip_audit_file) -> Dict:
         """Process a single slip audit file and return results."""
@@ -880,45 +893,10 @@ class ExcelProcessorService:
                             finally:
                                 os.unlink(temp_file.name)
 
-                    # Process members from member_names file
-                    for index, row in member_df.iterrows():
-                        try:
-                            # Extract member names directly from row
-                            if 'First Name' in row and 'Last Name' in row:
-                                first_name = row['First Name']
-                                last_name = row['Last Name']
-                            else:
-                                continue  # Skip if columns don't exist
-
-                            # Check for valid names
-                            if pd.isna(first_name) or pd.isna(last_name):
-                                continue  # Skip rows without proper names
-
-                            first_name_str = str(first_name).strip()
-                            last_name_str = str(last_name).strip()
-
-                            if not first_name_str or not last_name_str:
-                                continue
-
-                            # Create or get member using MemberService
-                            member, created = MemberService.get_or_create_member(
-                                chapter=self.chapter,
-                                first_name=first_name_str,
-                                last_name=last_name_str,
-                                business_name='',
-                                classification='',
-                                is_active=True
-                            )
-
-                            if created:
-                                members_created += 1
-                                logger.info(f"Created member: {member.full_name}")
-                            else:
-                                members_updated += 1
-
-                        except Exception as e:
-                            logger.error(f"Error processing member row {index}: {str(e)}")
-                            self.warnings.append(f"Error processing member row {index}: {str(e)}")
+                    # Create members from member_names file
+                    member_result = self._sync_members(member_df)
+                    members_created = member_result['created']
+                    members_updated = member_result['updated']
 
                 # Process the slip audit file
                 # Handle both InMemoryUploadedFile and TemporaryUploadedFile
@@ -992,7 +970,6 @@ class ExcelProcessorService:
         members = list(Member.objects.filter(chapter=self.chapter, is_active=True))
         referrals = list(Referral.objects.filter(giver__chapter=self.chapter))
         one_to_ones = list(OneToOne.objects.filter(member1__chapter=self.chapter))
-        tyfcbs = list(TYFCB.objects.filter(receiver__chapter=self.chapter))
 
         generator = MatrixGenerator(members)
 
@@ -1013,21 +990,25 @@ class ExcelProcessorService:
             'legend': {'0': 'Neither', '1': 'One-to-One Only', '2': 'Referral Only', '3': 'Both'}
         }
 
-        # Cache TYFCB data
-        inside_tyfcbs = [t for t in tyfcbs if t.within_chapter]
-        outside_tyfcbs = [t for t in tyfcbs if not t.within_chapter]
+        # Cache TYFCB data, summed per receiver in the database
+        tyfcb_totals = {True: {}, False: {}}
+        tyfcb_rows = (
+            TYFCB.objects.filter(receiver__chapter=self.chapter)
+            .values('within_chapter', 'receiver_id')
+            .annotate(total=Sum('amount'), count=Count('id'))
+        )
+        for row in tyfcb_rows:
+            tyfcb_totals[row['within_chapter']][row['receiver_id']] = (float(row['total']), row['count'])
 
-        monthly_report.tyfcb_inside_data = {
-            'total_amount': sum(float(t.amount) for t in inside_tyfcbs),
-            'count': len(inside_tyfcbs),
-            'by_member': {m.full_name: sum(float(t.amount) for t in inside_tyfcbs if t.receiver == m) for m in members}
-        }
+        def tyfcb_summary(totals):
+            return {
+                'total_amount': sum(total for total, _ in totals.values()),
+                'count': sum(count for _, count in totals.values()),
+                'by_member': {m.full_name: totals.get(m.id, (0, 0))[0] for m in members}
+            }
 
-        monthly_report.tyfcb_outside_data = {
-            'total_amount': sum(float(t.amount) for t in outside_tyfcbs),
-            'count': len(outside_tyfcbs),
-            'by_member': {m.full_name: sum(float(t.amount) for t in outside_tyfcbs if t.receiver == m) for m in members}
-        }
+        monthly_report.tyfcb_inside_data = tyfcb_summary(tyfcb_totals[True])
+        monthly_report.tyfcb_outside_data = tyfcb_summary(tyfcb_totals[False])
 
         monthly_report.save()
         logger.info(f"Matrices cached successfully for {monthly_report}")
@@ -1144,86 +1125,7 @@ class BNIMonthlyDataImportService:
         Parse XML-based Excel files (like BNI audit reports) and convert to DataFrame.
         Handles sparse cells (cells with Index attribute indicating position).
         """
-        import xml.etree.ElementTree as ET
-
-        # Parse the XML
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
-
-        # Define namespace
-        ns = {
-            'ss': 'urn:schemas-microsoft-com:office:spreadsheet',
-            'o': 'urn:schemas-microsoft-com:office:office',
-            'x': 'urn:schemas-microsoft-com:office:excel',
-            'html': 'http://www.w3.org/TR/REC-html40'
-        }
-
-        # Find the worksheet
-        worksheet = root.find('.//ss:Worksheet', ns)
-        if worksheet is None:
-            raise ValueError("No worksheet found in XML file")
-
-        # Find the table
-        table = worksheet.find('.//ss:Table', ns)
-        if table is None:
-            raise ValueError("No table found in worksheet")
-
-        # Extract data from rows
-        data_rows = []
-        headers = []
-        max_cols = 0
-
-        rows = table.findall('.//ss:Row', ns)
-        for i, row in enumerate(rows):
-            cells = row.findall('.//ss:Cell', ns)
-            row_data = []
-            col_index = 0
-
-            for cell in cells:
-                # Check if cell has an Index attribute (sparse cells)
-                index_attr = cell.get(f'{{{ns["ss"]}}}Index')
-                if index_attr:
-                    # Cell is at specific index (1-based), fill gaps with empty strings
-                    target_index = int(index_attr) - 1
-                    while col_index < target_index:
-                        row_data.append("")
-                        col_index += 1
-
-                # Extract cell value
-                data_elem = cell.find('.//ss:Data', ns)
-                if data_elem is not None:
-                    cell_value = data_elem.text if data_elem.text else ""
-                else:
-                    cell_value = ""
-                row_data.append(cell_value)
-                col_index += 1
-
-            # Track maximum column count
-            max_cols = max(max_cols, len(row_data))
-
-            if i == 0:
-                # First row is headers
-                headers = row_data
-            else:
-                # Data rows
-                data_rows.append(row_data)
-
-        # Create DataFrame
-        if not headers:
-            raise ValueError("No headers found in XML file")
-
-        # Pad headers and data rows to match maximum column count
-        while len(headers) < max_cols:
-            headers.append(f"Column_{len(headers)}")
-
-        for row in data_rows:
-            while len(row) < max_cols:
-                row.append("")
-
-        df = pd.DataFrame(data_rows, columns=headers)
-        logger.info(f"Successfully parsed XML Excel file with {len(df)} rows and {len(df.columns)} columns")
-
-        return df
+        return parse_spreadsheet_xml(xml_file_path)
     
     def _process_member_data(self, df: pd.DataFrame, chapter: Chapter, report_month: date):
         """
@@ -0,0 +1,246 @@
+"""
+Member Analytics Service - Per-member performance and gap analysis
+
+Computes the member analytics payload (performance, scores, gaps and
+recommendations) and caches it per chapter/member/day so repeated dashboard
+views do not recompute it.
+"""
+import logging
+from typing import Dict, Any
+from django.core.cache import cache
+from django.db import connection, models
+from django.utils import timezone
+from members.models import Member
+from chapters.models import Chapter
+from analytics.models import Referral, OneToOne, TYFCB
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_CACHE_TIMEOUT = 300  # seconds
+
+# One row per other active chapter member with a 0/1 flag for each missing
+# interaction, so the gap/priority set math runs in the database. Table names
+# are filled in from the models' db_table.
+MEMBER_GAPS_SQL = """
+WITH others AS (
+    SELECT id, first_name, last_name, business_name, classification
+    FROM {member_table}
+    WHERE chapter_id = %(chapter_id)s AND is_active = %(active)s AND id <> %(member_id)s
+),
+given AS (
+    SELECT DISTINCT receiver_id AS id FROM {referral_table} WHERE giver_id = %(member_id)s
+),
+received AS (
+    SELECT DISTINCT giver_id AS id FROM {referral_table} WHERE receiver_id = %(member_id)s
+),
+met AS (
+    SELECT member2_id AS id FROM {onetoone_table} WHERE member1_id = %(member_id)s
+    UNION
+    SELECT member1_id AS id FROM {onetoone_table} WHERE member2_id = %(member_id)s
+),
+gaps AS (
+    SELECT o.id, o.first_name, o.last_name, o.business_name, o.classification,
+           CASE WHEN met.id IS NULL THEN 1 ELSE 0 END AS missing_oto,
+           CASE WHEN given.id IS NULL THEN 1 ELSE 0 END AS missing_given,
+           CASE WHEN received.id IS NULL THEN 1 ELSE 0 END AS missing_received
+    FROM others o
+    LEFT JOIN met ON met.id = o.id
+    LEFT JOIN given ON given.id = o.id
+    LEFT JOIN received ON received.id = o.id
+)
+SELECT id, first_name, last_name, business_name, classification,
+       missing_oto, missing_given, missing_received,
+       CASE WHEN missing_oto + missing_given + missing_received >= 2 THEN 1 ELSE 0 END AS is_priority
+FROM gaps
+ORDER BY id
+"""
+
+
+class MemberAnalyticsService:
+    """Service for computing and caching member analytics."""
+
+    @staticmethod
+    def _version_key(chapter_id: int) -> str:
+        return f"analytics:version:{chapter_id}"
+
+    @staticmethod
+    def get_member_analytics(chapter: Chapter, member: Member) -> Dict[str, Any]:
+        """
+        Get analytics for a member, served from cache when available.
+
+        Args:
+            chapter: Chapter instance
+            member: Member instance in that chapter
+
+        Returns:
+            Analytics payload dictionary
+        """
+        version = cache.get(MemberAnalyticsService._version_key(chapter.id), 0)
+        cache_key = (
+            f"analytics:{chapter.id}:{member.id}:"
+            f"{timezone.now().date().isoformat()}:{version}"
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = MemberAnalyticsService.compute_member_analytics(chapter, member)
+            cache.set(cache_key, data, ANALYTICS_CACHE_TIMEOUT)
+        return data
+
+    @staticmethod
+    def invalidate_chapter(chapter_id: int) -> None:
+        """Invalidate cached analytics for every member of a chapter."""
+        version_key = MemberAnalyticsService._version_key(chapter_id)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, None)
+
+    @staticmethod
+    def compute_member_analytics(chapter: Chapter, member: Member) -> Dict[str, Any]:
+        """
+        Compute the full analytics payload for a member.
+
+        Args:
+            chapter: Chapter instance
+            member: Member instance in that chapter
+
+        Returns:
+            Analytics payload dictionary
+        """
+        # Calculate performance metrics (counts in one query)
+        referral_counts = Referral.objects.filter(
+            models.Q(giver=member) | models.Q(receiver=member)
+        ).aggregate(
+            given=models.Count('id', filter=models.Q(giver=member)),
+            received=models.Count('id', filter=models.Q(receiver=member)),
+            receivers=models.Count('receiver', filter=models.Q(giver=member), distinct=True)
+        )
+        referrals_given = referral_counts['given']
+        referrals_received = referral_counts['received']
+
+        # Get one-to-ones
+        oto_count = OneToOne.objects.filter(
+            models.Q(member1=member) | models.Q(member2=member)
+        ).count()
+
+        # Get TYFCB data
+        tyfcb_totals = TYFCB.objects.filter(receiver=member).aggregate(
+            total=models.Sum('amount'),
+            inside=models.Sum('amount', filter=models.Q(within_chapter=True)),
+            outside=models.Sum('amount', filter=models.Q(within_chapter=False))
+        )
+        total_tyfcb = float(tyfcb_totals['total'] or 0)
+        tyfcb_inside = float(tyfcb_totals['inside'] or 0)
+        tyfcb_outside = float(tyfcb_totals['outside'] or 0)
+
+        # Calculate gaps and priority connections against all other active members
+        with connection.cursor() as cursor:
+            cursor.execute(MEMBER_GAPS_SQL.format(
+                member_table=connection.ops.quote_name(Member._meta.db_table),
+                referral_table=connection.ops.quote_name(Referral._meta.db_table),
+                onetoone_table=connection.ops.quote_name(OneToOne._meta.db_table),
+            ), {
+                'chapter_id': chapter.id,
+                'member_id': member.id,
+                'active': True,
+            })
+            gap_rows = cursor.fetchall()
+
+        total_members = len(gap_rows)
+        missing_otos = []
+        missing_referrals_given = []
+        missing_referrals_received = []
+        priority_members = []
+        for (member_id, first_name, last_name, business_name, classification,
+             missing_oto, missing_given, missing_received, is_priority) in gap_rows:
+            if missing_oto:
+                missing_otos.append(member_id)
+            if missing_given:
+                missing_referrals_given.append(member_id)
+            if missing_received:
+                missing_referrals_received.append(member_id)
+            if is_priority:
+                priority_members.append({
+                    'id': member_id,
+                    'name': f"{first_name} {last_name}",
+                    'business_name': business_name,
+                    'classification': classification
+                })
+
+        # Calculate completion rates
+        oto_completion = round((oto_count / total_members * 100), 1) if total_members > 0 else 0
+        referral_completion = round((referral_counts['receivers'] / total_members * 100), 1) if total_members > 0 else 0
+
+        # Performance scores
+        oto_score = min(100, round((oto_count / total_members) * 100, 1)) if total_members > 0 else 0
+        referral_score = min(100, round((referrals_given / total_members) * 50, 1)) if total_members > 0 else 0
+        tyfcb_score = min(100, round(total_tyfcb / 1000, 1))  # Score based on AED amounts
+        overall_score = round((oto_score + referral_score + tyfcb_score) / 3, 1)
+
+        # Generate AI recommendations
+        recommendations = []
+        if oto_completion < 50:
+            recommendations.append({
+                'type': 'warning',
+                'category': 'one_to_ones',
+                'message': f'Low 1-2-1 completion rate ({oto_completion}%). Focus on scheduling more meetings.',
+                'priority': 'high'
+            })
+
+        if priority_members:
+            recommendations.append({
+                'type': 'action',
+                'category': 'priority_connections',
+                'message': f'Connect with {len(priority_members)} priority members to maximize impact.',
+                'priority': 'high'
+            })
+
+        if referrals_given < total_members * 0.5:
+            recommendations.append({
+                'type': 'warning',
+                'category': 'referrals',
+                'message': 'Increase referral giving to strengthen relationships.',
+                'priority': 'medium'
+            })
+
+        if overall_score >= 80:
+            recommendations.append({
+                'type': 'success',
+                'category': 'performance',
+                'message': 'Excellent performance! Keep up the great networking.',
+                'priority': 'low'
+            })
+
+        return {
+            'member': {
+                'id': member.id,
+                'name': member.full_name,
+                'business_name': member.business_name,
+                'classification': member.classification
+            },
+            'performance': {
+                'referrals_given': referrals_given,
+                'referrals_received': referrals_received,
+                'one_to_ones': oto_count,
+                'tyfcb_total': total_tyfcb,
+                'tyfcb_inside': tyfcb_inside,
+                'tyfcb_outside': tyfcb_outside
+            },
+            'scores': {
+                'overall': overall_score,
+                'one_to_one': oto_score,
+                'referral': referral_score,
+                'tyfcb': tyfcb_score
+            },
+            'completion_rates': {
+                'one_to_ones': oto_completion,
+                'referrals': referral_completion
+            },
+            'gaps': {
+                'missing_otos': missing_otos,
+                'missing_referrals_given': missing_referrals_given,
+                'missing_referrals_received': missing_referrals_received,
+                'priority_connections': priority_members
+            },
+            'recommendations': recommendations
+        }
@@ -109,7 +109,7 @@ class MemberService:
         """
         try:
             member = Member.objects.get(id=member_id)
-            updated = False
+            changed_fields = []
 
             # Track if names changed
             name_changed = False
@@ -125,7 +125,7 @@ class MemberService:
                     old_value = getattr(member, field)
                     if old_value != value:
                         setattr(member, field, value)
-                        updated = True
+                        changed_fields.append(field)
                         if field in ['first_name', 'last_name']:
                             name_changed = True
 
@@ -134,11 +134,14 @@ class MemberService:
                 member.normalized_name = Member.normalize_name(
                     f"{member.first_name} {member.last_name}"
                 )
+                changed_fields.append('normalized_name')
 
+            updated = bool(changed_fields)
             if updated:
                 # Validate before saving
                 member.full_clean()
-                member.save()
+                # Only write the columns that changed (plus the auto_now timestamp)
+                member.save(update_fields=changed_fields + ['updated_at'])
                 logger.info(f"Updated member: {member.full_name} (ID: {member_id})")
 
             return member, updated
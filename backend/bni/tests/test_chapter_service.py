@@ -0,0 +1,54 @@
+"""
+Tests for ChapterService's cached member roster lookups.
+"""
+import pandas as pd
+from django.test import TestCase
+from chapters.models import Chapter
+from members.models import Member
+from bni.services.chapter_service import ChapterService
+from bni.services.excel_processor import ExcelProcessorService
+
+
+class ChapterMemberCacheTestCase(TestCase):
+    """Test that cached member IDs/names follow member changes."""
+
+    def setUp(self):
+        """Create a chapter with two members."""
+        self.chapter = Chapter.objects.create(name='Test Chapter', location='Dubai')
+        self.jane = Member.objects.create(chapter=self.chapter, first_name='Jane', last_name='Doe')
+        self.john = Member.objects.create(chapter=self.chapter, first_name='John', last_name='Smith')
+
+    def test_active_member_names_served_from_cache(self):
+        """A second lookup doesn't hit the database."""
+        expected = {self.jane.id: 'Jane Doe', self.john.id: 'John Smith'}
+        self.assertEqual(ChapterService.get_active_member_names(self.chapter.id), expected)
+        with self.assertNumQueries(0):
+            self.assertEqual(ChapterService.get_active_member_names(self.chapter.id), expected)
+
+    def test_member_changes_invalidate_cache(self):
+        """Saving or deactivating a member refreshes both cached lookups."""
+        ChapterService.get_active_member_names(self.chapter.id)
+        ChapterService.get_active_member_ids(self.chapter.id)
+
+        self.jane.last_name = 'Roe'
+        self.jane.save()
+        self.john.is_active = False
+        self.john.save()
+
+        self.assertEqual(ChapterService.get_active_member_names(self.chapter.id), {self.jane.id: 'Jane Roe'})
+        self.assertEqual(ChapterService.get_active_member_ids(self.chapter.id), frozenset({self.jane.id}))
+
+    def test_roster_bulk_create_invalidates_cache(self):
+        """Members bulk-created from a roster file show up in the cached lookups."""
+        ChapterService.get_active_member_ids(self.chapter.id)
+        roster = pd.DataFrame({
+            'First Name': ['Jane', 'Amir', 'Amir', None],
+            'Last Name': ['Doe', 'Khan', 'Khan', 'Nobody'],
+        })
+
+        result = ExcelProcessorService(self.chapter)._sync_members(roster)
+
+        self.assertEqual(result, {'created': 1, 'updated': 2})
+        amir = Member.objects.get(chapter=self.chapter, first_name='Amir')
+        self.assertEqual(amir.normalized_name, Member.normalize_name('Amir Khan'))
+        self.assertIn(amir.id, ChapterService.get_active_member_ids(self.chapter.id))
@@ -0,0 +1,51 @@
+"""
+Tests for caching of the report matrices Excel download.
+"""
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from chapters.models import Chapter
+from reports.models import MonthlyReport
+from reports.views import MonthlyReportViewSet
+
+
+class DownloadMatricesCacheTestCase(TestCase):
+    """Test that workbooks are cached only in a shared cache backend."""
+
+    def setUp(self):
+        """Create a processed report without matrix data."""
+        cache.clear()
+        self.chapter = Chapter.objects.create(name='Test Chapter', location='Dubai')
+        report = MonthlyReport.objects.create(
+            chapter=self.chapter, month_year='2025-08', processed_at=timezone.now()
+        )
+        self.url = f'/api/chapters/{self.chapter.id}/reports/{report.id}/download-matrices/'
+
+    def download_twice(self):
+        """Download the workbook twice and return how many times it was built."""
+        build = MonthlyReportViewSet._build_matrices_workbook
+        with mock.patch.object(
+            MonthlyReportViewSet, '_build_matrices_workbook', autospec=True, side_effect=build
+        ) as build_mock:
+            for _ in range(2):
+                response = self.client.get(self.url)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.content.startswith(b'PK'))
+        return build_mock.call_count
+
+    def test_locmem_cache_does_not_store_workbooks(self):
+        """With the per-process LocMem cache every download builds the workbook."""
+        self.assertEqual(self.download_twice(), 2)
+
+    def test_shared_cache_reuses_workbook(self):
+        """With a shared cache the second download is served from the cache."""
+        with tempfile.TemporaryDirectory() as cache_dir, override_settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': cache_dir,
+            }
+        }):
+            self.assertEqual(self.download_twice(), 1)
@@ -0,0 +1,155 @@
+"""
+Tests for the member analytics endpoint and its gap/priority calculations.
+"""
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import TestCase
+from chapters.models import Chapter
+from members.models import Member
+from analytics.models import Referral, OneToOne
+from bni.services.member_analytics_service import MemberAnalyticsService
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+class MemberAnalyticsGapsTestCase(TestCase):
+    """Test gap lists, priority connections and completion rates."""
+
+    def setUp(self):
+        """
+        Create a chapter around Jane with an inactive member and a member of
+        another chapter.
+
+        Jane met Amir (as member1) and Bella (as member2), referred Amir and
+        twice an outside member, and was referred by Chen and by inactive Dan.
+        """
+        cache.clear()
+        self.chapter = Chapter.objects.create(name='Test Chapter', location='Dubai')
+        other_chapter = Chapter.objects.create(name='Other Chapter', location='Dubai')
+
+        def member(first_name, last_name, chapter=self.chapter, **kwargs):
+            return Member.objects.create(
+                chapter=chapter, first_name=first_name, last_name=last_name, **kwargs
+            )
+
+        self.jane = member('Jane', 'Doe')
+        self.amir = member('Amir', 'Khan', business_name='Khan Legal', classification='Lawyer')
+        self.bella = member('Bella', 'Cruz', business_name='Cruz Design', classification='Designer')
+        self.chen = member('Chen', 'Li', business_name='Li Travel', classification='Travel')
+        self.dan = member('Dan', 'Gone', is_active=False)
+        outsider = member('Omar', 'Out', chapter=other_chapter)
+
+        OneToOne.objects.create(member1=self.jane, member2=self.amir)
+        OneToOne.objects.create(member1=self.bella, member2=self.jane)
+        Referral.objects.create(giver=self.jane, receiver=self.amir)
+        Referral.objects.create(giver=self.jane, receiver=outsider)
+        Referral.objects.create(giver=self.jane, receiver=outsider)
+        Referral.objects.create(giver=self.chen, receiver=self.jane)
+        Referral.objects.create(giver=self.dan, receiver=self.jane)
+
+    def get_analytics(self):
+        response = self.client.get(f'/api/chapters/{self.chapter.id}/members/Jane%20Doe/analytics/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_gaps_and_priority_connections(self):
+        """Gaps cover only other active chapter members; priority means two or more gaps."""
+        data = self.get_analytics()
+
+        self.assertEqual(data['gaps']['missing_otos'], [self.chen.id])
+        self.assertEqual(data['gaps']['missing_referrals_given'], [self.bella.id, self.chen.id])
+        self.assertEqual(data['gaps']['missing_referrals_received'], [self.amir.id, self.bella.id])
+        self.assertEqual(data['gaps']['priority_connections'], [
+            {'id': self.bella.id, 'name': 'Bella Cruz',
+             'business_name': 'Cruz Design', 'classification': 'Designer'},
+            {'id': self.chen.id, 'name': 'Chen Li',
+             'business_name': 'Li Travel', 'classification': 'Travel'},
+        ])
+
+    def test_performance_and_completion_rates(self):
+        """Counts include outside and inactive members; rates divide by active peers."""
+        data = self.get_analytics()
+
+        self.assertEqual(data['performance']['referrals_given'], 3)
+        self.assertEqual(data['performance']['referrals_received'], 2)
+        self.assertEqual(data['performance']['one_to_ones'], 2)
+        # 2 one-to-ones and 2 distinct referral receivers against 3 active peers
+        self.assertEqual(data['completion_rates'], {'one_to_ones': 66.7, 'referrals': 66.7})
+
+
+class MemberAnalyticsCacheTestCase(TestCase):
+    """Test that cached analytics are reused until the chapter changes."""
+
+    def setUp(self):
+        """Create a chapter named like the upload fixtures, with two members."""
+        cache.clear()
+        self.chapter = Chapter.objects.create(name='BNI Continental', location='Dubai')
+        self.jane = Member.objects.create(chapter=self.chapter, first_name='Jane', last_name='Doe')
+        self.amir = Member.objects.create(chapter=self.chapter, first_name='Amir', last_name='Khan')
+        self.url = f'/api/chapters/{self.chapter.id}/members/Jane%20Doe/analytics/'
+
+    def test_second_read_is_served_from_cache(self):
+        """Reading twice without a write computes the analytics once."""
+        first = MemberAnalyticsService.get_member_analytics(self.chapter, self.jane)
+        with self.assertNumQueries(0):
+            second = MemberAnalyticsService.get_member_analytics(self.chapter, self.jane)
+        self.assertEqual(first, second)
+
+    def test_invalidate_starts_and_bumps_version(self):
+        """The first invalidation creates the version key, later ones increment it."""
+        version_key = MemberAnalyticsService._version_key(self.chapter.id)
+        # Creating the members in setUp already bumped it
+        cache.delete(version_key)
+        MemberAnalyticsService.invalidate_chapter(self.chapter.id)
+        self.assertEqual(cache.get(version_key), 1)
+        MemberAnalyticsService.invalidate_chapter(self.chapter.id)
+        self.assertEqual(cache.get(version_key), 2)
+
+    def test_member_api_writes_refresh_analytics(self):
+        """Creating and deleting a member through the API busts the cached analytics."""
+        self.assertEqual(self.client.get(self.url).json()['gaps']['missing_otos'], [self.amir.id])
+
+        # A raw ORM write is not a cache-busting path, so the cached copy is served
+        Referral.objects.create(giver=self.jane, receiver=self.amir)
+        self.assertEqual(self.client.get(self.url).json()['performance']['referrals_given'], 0)
+
+        response = self.client.post(f'/api/chapters/{self.chapter.id}/members/', {
+            'first_name': 'Bella', 'last_name': 'Cruz',
+        })
+        self.assertEqual(response.status_code, 201)
+        bella_id = response.json()['id']
+        data = self.client.get(self.url).json()
+        self.assertEqual(data['gaps']['missing_otos'], [self.amir.id, bella_id])
+        self.assertEqual(data['performance']['referrals_given'], 1)
+
+        self.client.delete(f'/api/chapters/{self.chapter.id}/members/{self.amir.id}/')
+        data = self.client.get(self.url).json()
+        self.assertEqual(data['gaps']['missing_otos'], [bella_id])
+        self.assertEqual(data['performance']['referrals_given'], 0)
+
+    def test_upload_refreshes_analytics(self):
+        """Uploading a roster busts the cached analytics for the chapter."""
+        before = self.client.get(self.url).json()['gaps']['missing_otos']
+        self.assertEqual(before, [self.amir.id])
+
+        # The upload invalidates the analytics on commit
+        with open(FIXTURES_DIR / 'continental_slip_audit_aug2025.xls', 'rb') as slip_file, \
+                open(FIXTURES_DIR / 'continental_members_aug2025.xls', 'rb') as members_file, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/upload/excel/', {
+                'slip_audit_files': [slip_file],
+                'member_names_file': members_file,
+                'chapter_id': self.chapter.id,
+                'month_year': '2025-08',
+                'upload_option': 'slip_and_members',
+            })
+        self.assertEqual(response.status_code, 200)
+
+        after = self.client.get(self.url).json()['gaps']['missing_otos']
+        expected = sorted(
+            Member.objects.filter(chapter=self.chapter, is_active=True)
+            .exclude(id=self.jane.id).values_list('id', flat=True)
+        )
+        self.assertGreater(len(expected), 1)
+        self.assertEqual(after, expected)
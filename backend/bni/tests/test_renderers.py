@@ -0,0 +1,32 @@
+"""
+Tests for the orjson-backed API renderer.
+
+The renderer must produce the same JSON as DRF's default JSONRenderer.
+"""
+import datetime
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from bni.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    """Compare ORJSONRenderer output with DRF's JSONRenderer."""
+
+    def test_matches_drf_json_renderer(self):
+        """Datetimes, dates, decimals and non-string keys render identically."""
+        data = {
+            'processed_at': timezone.now(),
+            'month': datetime.date(2025, 8, 1),
+            'amount': Decimal('1500.50'),
+            'by_member': {'Jane Doe': 10.5},
+            1: [1, 2, 3],
+            'name': 'Zoë',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        """A None payload (e.g. 204 responses) renders as an empty body."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
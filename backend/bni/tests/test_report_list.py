@@ -0,0 +1,46 @@
+"""
+Tests for the monthly report list endpoint's conditional GET handling.
+"""
+from django.test import TestCase
+from django.utils import timezone
+from chapters.models import Chapter
+from reports.models import MonthlyReport
+
+
+class ReportListETagTestCase(TestCase):
+    """Test ETag / If-None-Match handling on the report list."""
+
+    def setUp(self):
+        """Create a chapter with one processed report."""
+        self.chapter = Chapter.objects.create(name='Test Chapter', location='Dubai')
+        self.report = MonthlyReport.objects.create(
+            chapter=self.chapter, month_year='2025-08', processed_at=timezone.now()
+        )
+        self.url = f'/api/chapters/{self.chapter.id}/reports/'
+
+    def test_matching_etag_returns_304(self):
+        """An unchanged list is answered with 304 Not Modified."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_and_deleted_reports_change_etag(self):
+        """Adding or deleting a report invalidates clients' cached lists."""
+        etag = self.client.get(self.url)['ETag']
+        new_report = MonthlyReport.objects.create(chapter=self.chapter, month_year='2025-09')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+
+        etag = response['ETag']
+        new_report.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_unknown_chapter_is_not_conditional(self):
+        """A missing chapter still returns 404 rather than a cached 304."""
+        response = self.client.get('/api/chapters/9999/reports/', HTTP_IF_NONE_MATCH='"*"')
+        self.assertEqual(response.status_code, 404)
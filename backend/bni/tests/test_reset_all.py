@@ -0,0 +1,44 @@
+"""
+Tests for the reset-all upload endpoint.
+"""
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from chapters.models import Chapter
+from members.models import Member
+from reports.models import MonthlyReport
+from analytics.models import Referral
+from bni.services.chapter_service import ChapterService
+
+
+class ResetAllDataTestCase(TestCase):
+    """Test that reset-all empties every table and the chapter caches."""
+
+    def setUp(self):
+        """Create a chapter with members, a referral and a report."""
+        self.chapter = Chapter.objects.create(name='Test Chapter', location='Dubai')
+        giver = Member.objects.create(chapter=self.chapter, first_name='Jane', last_name='Doe')
+        receiver = Member.objects.create(chapter=self.chapter, first_name='John', last_name='Smith')
+        Referral.objects.create(giver=giver, receiver=receiver, date_given=date(2025, 8, 1))
+        MonthlyReport.objects.create(chapter=self.chapter, month_year='2025-08')
+
+    def test_reset_reports_counts_and_deletes_everything(self):
+        """The response reports pre-delete counts and all rows are removed."""
+        ChapterService.get_active_member_ids(self.chapter.id)
+        cache.set('unrelated:key', 'kept')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/upload/reset-all/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['deleted'], {
+            'chapters': 1, 'members': 2, 'monthly_reports': 1, 'member_stats': 0,
+            'referrals': 1, 'one_to_ones': 0, 'tyfcbs': 0,
+        })
+        self.assertFalse(Chapter.objects.exists())
+        self.assertFalse(Member.objects.exists())
+        self.assertFalse(Referral.objects.exists())
+        self.assertEqual(ChapterService.get_active_member_ids(self.chapter.id), frozenset())
+        # The cache may be shared, so keys outside the chapter caches survive
+        self.assertEqual(cache.get('unrelated:key'), 'kept')
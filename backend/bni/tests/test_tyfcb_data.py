@@ -0,0 +1,104 @@
+"""
+Tests for the report TYFCB data endpoint's conditional GET handling and the
+cached TYFCB totals it serves.
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+from chapters.models import Chapter
+from members.models import Member
+from reports.models import MonthlyReport
+from analytics.models import TYFCB
+from bni.services.excel_processor import ExcelProcessorService
+
+
+class TYFCBDataETagTestCase(TestCase):
+    """Test ETag / If-None-Match handling on the tyfcb-data endpoint."""
+
+    def setUp(self):
+        """Create a processed report with TYFCB data."""
+        self.chapter = Chapter.objects.create(name='Test Chapter', location='Dubai')
+        self.report = MonthlyReport.objects.create(
+            chapter=self.chapter,
+            month_year='2025-08',
+            processed_at=timezone.now(),
+            tyfcb_inside_data={'total_amount': 10, 'count': 1, 'by_member': {'Jane Doe': 10}}
+        )
+        self.url = f'/api/chapters/{self.chapter.id}/reports/{self.report.id}/tyfcb-data/'
+
+    def test_returns_etag_and_data(self):
+        """A plain GET returns the data with an ETag."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        data = response.json()
+        self.assertEqual(data['inside']['by_member'], {'Jane Doe': 10})
+        self.assertEqual(data['outside'], {'total_amount': 0, 'count': 0, 'by_member': {}})
+
+    def test_matching_etag_returns_304(self):
+        """A GET with the current ETag is answered with 304 Not Modified."""
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_reprocessed_report_changes_etag(self):
+        """Reprocessing a report invalidates clients' cached copies."""
+        etag = self.client.get(self.url)['ETag']
+        self.report.processed_at = self.report.processed_at + timedelta(minutes=1)
+        self.report.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_reprocess_within_same_second_changes_etag(self):
+        """The ETag has sub-second precision, so a quick reprocess is not a 304."""
+        self.report.processed_at = self.report.processed_at.replace(microsecond=1000)
+        self.report.save()
+        etag = self.client.get(self.url)['ETag']
+        self.report.processed_at = self.report.processed_at.replace(microsecond=2000)
+        self.report.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_gzipped_response_still_revalidates(self):
+        """The weak ETag sent with gzipped responses still yields 304."""
+        # GZipMiddleware skips bodies under 200 bytes
+        self.report.tyfcb_outside_data = {
+            'total_amount': 200, 'count': 20,
+            'by_member': {f'Member{i} Test': 10 for i in range(20)}
+        }
+        self.report.save()
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+class TYFCBCachedTotalsTestCase(TestCase):
+    """Test the TYFCB totals cached on a report when matrices are generated."""
+
+    def test_totals_split_by_inside_and_outside(self):
+        """Amounts are summed per receiver and members without TYFCB show 0."""
+        chapter = Chapter.objects.create(name='Test Chapter', location='Dubai')
+        jane = Member.objects.create(chapter=chapter, first_name='Jane', last_name='Doe')
+        john = Member.objects.create(chapter=chapter, first_name='John', last_name='Smith')
+        TYFCB.objects.create(receiver=jane, giver=john, amount=Decimal('100.50'))
+        TYFCB.objects.create(receiver=jane, giver=john, amount=Decimal('50.25'))
+        TYFCB.objects.create(receiver=john, amount=Decimal('2000'), within_chapter=False)
+        report = MonthlyReport.objects.create(chapter=chapter, month_year='2025-08')
+
+        ExcelProcessorService(chapter)._generate_and_cache_matrices(report)
+
+        report.refresh_from_db()
+        self.assertEqual(report.tyfcb_inside_data, {
+            'total_amount': 150.75, 'count': 2,
+            'by_member': {'Jane Doe': 150.75, 'John Smith': 0},
+        })
+        self.assertEqual(report.tyfcb_outside_data, {
+            'total_amount': 2000.0, 'count': 1,
+            'by_member': {'Jane Doe': 0, 'John Smith': 2000.0},
+        })
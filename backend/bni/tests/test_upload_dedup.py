@@ -0,0 +1,71 @@
+"""
+Tests for skipping re-processing of identical Excel uploads.
+"""
+from pathlib import Path
+
+from django.test import TestCase
+from chapters.models import Chapter
+from reports.models import MonthlyReport
+from uploads.models import UploadedFileHash
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+class UploadDedupTestCase(TestCase):
+    """Test content-hash dedup on the Excel upload endpoint."""
+
+    def setUp(self):
+        """Create the chapter the fixture files belong to."""
+        self.chapter = Chapter.objects.create(name='BNI Continental', location='Dubai')
+
+    def upload(self):
+        """Upload the continental slip audit and member names fixtures."""
+        with open(FIXTURES_DIR / 'continental_slip_audit_aug2025.xls', 'rb') as slip_file, \
+                open(FIXTURES_DIR / 'continental_members_aug2025.xls', 'rb') as members_file:
+            return self.client.post('/api/upload/excel/', {
+                'slip_audit_files': [slip_file],
+                'member_names_file': members_file,
+                'chapter_id': self.chapter.id,
+                'month_year': '2025-08',
+                'upload_option': 'slip_and_members',
+            })
+
+    def test_identical_upload_returns_stored_result(self):
+        """A second identical upload is answered from the stored result."""
+        first = self.upload()
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn('duplicate_upload', first.json())
+        report = MonthlyReport.objects.get(chapter=self.chapter, month_year='2025-08')
+
+        second = self.upload()
+        self.assertEqual(second.status_code, 200)
+        self.assertTrue(second.json()['duplicate_upload'])
+        self.assertEqual(second.json()['monthly_report_id'], report.id)
+        # The report was not recreated
+        self.assertTrue(MonthlyReport.objects.filter(id=report.id).exists())
+
+    def test_member_delete_forces_reprocessing(self):
+        """Changing the roster drops stored hashes so the next upload is processed."""
+        self.upload()
+        member = self.chapter.members.first()
+        self.client.delete(f'/api/chapters/{self.chapter.id}/members/{member.id}/')
+        self.assertFalse(UploadedFileHash.objects.exists())
+
+        response = self.upload()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('duplicate_upload', response.json())
+
+    def test_member_write_outside_api_forces_reprocessing(self):
+        """Roster writes that skip the API (admin, shell) also drop stored hashes."""
+        self.upload()
+        self.chapter.members.create(first_name='New', last_name='Member')
+        self.assertFalse(UploadedFileHash.objects.exists())
+
+    def test_deleted_report_forces_reprocessing(self):
+        """Deleting the report removes its hash along with it."""
+        self.upload()
+        MonthlyReport.objects.filter(chapter=self.chapter).delete()
+
+        response = self.upload()
+        self.assertNotIn('duplicate_upload', response.json())
+        self.assertTrue(MonthlyReport.objects.filter(chapter=self.chapter).exists())
@@ -0,0 +1,50 @@
+"""
+Tests for the streaming SpreadsheetML (.xls XML) parser.
+"""
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+from bni.services.excel_processor import parse_spreadsheet_xml
+
+WORKBOOK = """<?xml version="1.0" encoding="UTF-8"?>
+<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"
+          xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">
+{worksheets}
+</Workbook>
+"""
+
+FIRST_SHEET = """<Worksheet ss:Name="Audit"><Table>
+<Row><Cell><Data ss:Type="String">From</Data></Cell><Cell><Data ss:Type="String">To</Data></Cell></Row>
+<Row><Cell><Data ss:Type="String">Jane Doe</Data></Cell><Cell ss:Index="3"><Data ss:Type="Number">5</Data></Cell></Row>
+<Row><Cell/><Cell><Data ss:Type="String">John Smith</Data></Cell></Row>
+</Table></Worksheet>"""
+
+SECOND_SHEET = """<Worksheet ss:Name="Other"><Table>
+<Row><Cell><Data ss:Type="String">Ignored</Data></Cell></Row>
+</Table></Worksheet>"""
+
+
+class SpreadsheetXMLParserTestCase(SimpleTestCase):
+    """Test parse_spreadsheet_xml against small hand-written workbooks."""
+
+    def parse(self, worksheets):
+        """Write a workbook with the given worksheets and parse it."""
+        with tempfile.NamedTemporaryFile('w', suffix='.xls', delete=False) as xml_file:
+            xml_file.write(WORKBOOK.format(worksheets=worksheets))
+        self.addCleanup(os.unlink, xml_file.name)
+        return parse_spreadsheet_xml(xml_file.name)
+
+    def test_first_table_with_sparse_cells(self):
+        """Only the first table is read and ss:Index gaps are padded."""
+        df = self.parse(FIRST_SHEET + SECOND_SHEET)
+        self.assertEqual(list(df.columns), ['From', 'To', 'Column_2'])
+        self.assertEqual(df.values.tolist(), [
+            ['Jane Doe', '', '5'],
+            ['', 'John Smith', ''],
+        ])
+
+    def test_missing_table_raises(self):
+        """A worksheet without a table is rejected."""
+        with self.assertRaisesMessage(ValueError, "No table found in worksheet"):
+            self.parse('<Worksheet ss:Name="Empty"></Worksheet>')
@@ -52,6 +52,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "django.middleware.gzip.GZipMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
 ]
@@ -75,7 +76,14 @@ if DATABASE_URL:
     import dj_database_url
 
     # Parse the connection string
-    db_config = dj_database_url.parse(DATABASE_URL, conn_max_age=600, ssl_require=True)
+    # Keep connections open between requests (set CONN_MAX_AGE=0 behind a
+    # transaction-mode pooler such as pgbouncer) and verify them before reuse
+    db_config = dj_database_url.parse(
+        DATABASE_URL,
+        conn_max_age=int(os.environ.get('CONN_MAX_AGE', 600)),
+        conn_health_checks=True,
+        ssl_require=True,
+    )
 
     # Add additional options for Supabase
     db_config['OPTIONS'] = {
@@ -96,6 +104,25 @@ else:
     }
 
 
+# Cache
+# Redis when REDIS_URL is provided (production), otherwise in-process memory
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # No authentication - removed auth system
 
 
@@ -127,6 +154,13 @@ else:
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# File uploads
+# Stream uploads straight to temp files: the Excel processor reads them by
+# path, so in-memory buffering would only be copied back out to disk
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -141,6 +175,9 @@ REST_FRAMEWORK = {
     "UNAUTHENTICATED_USER": None,  # Don't use Django User model
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 100,
+    "DEFAULT_RENDERER_CLASSES": [
+        "bni.renderers.ORJSONRenderer",
+    ],
 }
 
 # CORS settings
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='member',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['chapter', 'is_active', 'normalized_name'], name='member_chap_active_norm_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='member',
+            constraint=models.UniqueConstraint(fields=('chapter', 'normalized_name'), name='uniq_chapter_norm'),
+        ),
+    ]
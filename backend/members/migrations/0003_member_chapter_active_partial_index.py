@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0002_member_unique_constraint_and_lookup_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['chapter'], name='member_chapter_active_idx'),
+        ),
+    ]
@@ -1,10 +1,34 @@
 """
 Member models for BNI Analytics.
 """
+from functools import lru_cache
+
 from django.db import models
 from chapters.models import Chapter
 
 
+# Common prefixes/suffixes stripped during name normalization
+NAME_PREFIXES = frozenset({'mr.', 'mrs.', 'ms.', 'dr.', 'prof.'})
+NAME_SUFFIXES = frozenset({'jr.', 'sr.', 'ii', 'iii', 'iv'})
+
+
+@lru_cache(maxsize=8192)
+def _normalize(name):
+    """Normalize name for consistent matching (memoized)."""
+    # Convert to lowercase and remove extra spaces
+    parts = name.lower().split()
+
+    # Remove prefixes
+    if parts and parts[0] in NAME_PREFIXES:
+        parts = parts[1:]
+
+    # Remove suffixes
+    if parts and parts[-1] in NAME_SUFFIXES:
+        parts = parts[:-1]
+
+    return ' '.join(parts)
+
+
 class Member(models.Model):
     """A chapter member."""
     chapter = models.ForeignKey(Chapter, on_delete=models.CASCADE, related_name='members')
@@ -22,8 +46,16 @@ class Member(models.Model):
 
     class Meta:
         ordering = ['first_name', 'last_name']
-        unique_together = ['chapter', 'normalized_name']
         db_table = 'chapters_member'
+        constraints = [
+            models.UniqueConstraint(fields=['chapter', 'normalized_name'], name='uniq_chapter_norm'),
+        ]
+        indexes = [
+            # Analytics lookup by name and active-member list filters
+            models.Index(fields=['chapter', 'is_active', 'normalized_name'], name='member_chap_active_norm_idx'),
+            # Active-member listing per chapter
+            models.Index(fields=['chapter'], condition=models.Q(is_active=True), name='member_chapter_active_idx'),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -42,22 +74,4 @@ class Member(models.Model):
         """Normalize name for consistent matching."""
         if not name:
             return ""
-
-        # Convert to lowercase and remove extra spaces
-        normalized = ' '.join(name.lower().split())
-
-        # Remove common prefixes/suffixes
-        prefixes = ['mr.', 'mrs.', 'ms.', 'dr.', 'prof.']
-        suffixes = ['jr.', 'sr.', 'ii', 'iii', 'iv']
-
-        parts = normalized.split()
-
-        # Remove prefixes
-        if parts and parts[0] in prefixes:
-            parts = parts[1:]
-
-        # Remove suffixes
-        if parts and parts[-1] in suffixes:
-            parts = parts[:-1]
-
-        return ' '.join(parts)
+        return _normalize(name)
@@ -0,0 +1,15 @@
+"""
+Member signals - keep data derived from the chapter roster in sync.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from members.models import Member
+from bni.services.chapter_service import ChapterService
+
+
+@receiver(post_save, sender=Member)
+@receiver(post_delete, sender=Member)
+def invalidate_chapter_member_cache(sender, instance, **kwargs):
+    """Invalidate roster-derived caches and upload hashes when a member changes."""
+    ChapterService.invalidate_roster_data(instance.chapter_id)
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:39
+
+from django.db import migrations, models
+
+
+def backfill_matrix_flags(apps, schema_editor):
+    """Set the new flags from the existing matrix JSON in one UPDATE."""
+    MonthlyReport = apps.get_model('reports', 'MonthlyReport')
+    flags = {}
+    for data_field, flag_field in [
+        ('referral_matrix_data', 'has_referral_matrix'),
+        ('oto_matrix_data', 'has_oto_matrix'),
+        ('combination_matrix_data', 'has_combination_matrix'),
+    ]:
+        flags[flag_field] = models.ExpressionWrapper(
+            models.Q(**{f'{data_field}__isnull': False}) & ~models.Q(**{data_field: {}}),
+            output_field=models.BooleanField()
+        )
+    MonthlyReport.objects.update(**flags)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monthlyreport',
+            name='has_combination_matrix',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='monthlyreport',
+            name='has_oto_matrix',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='monthlyreport',
+            name='has_referral_matrix',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_matrix_flags, migrations.RunPython.noop),
+    ]
@@ -22,10 +22,21 @@ class MonthlyReport(models.Model):
     tyfcb_inside_data = models.JSONField(default=dict, blank=True)
     tyfcb_outside_data = models.JSONField(default=dict, blank=True)
 
+    # Matrix availability flags (kept in sync on save so listings skip the JSON)
+    has_referral_matrix = models.BooleanField(default=False)
+    has_oto_matrix = models.BooleanField(default=False)
+    has_combination_matrix = models.BooleanField(default=False)
+
     # Metadata
     uploaded_at = models.DateTimeField(auto_now_add=True)
     processed_at = models.DateTimeField(null=True, blank=True)
 
+    MATRIX_FLAGS = {
+        'referral_matrix_data': 'has_referral_matrix',
+        'oto_matrix_data': 'has_oto_matrix',
+        'combination_matrix_data': 'has_combination_matrix',
+    }
+
     class Meta:
         unique_together = ['chapter', 'month_year']
         ordering = ['-month_year']
@@ -34,6 +45,22 @@ class MonthlyReport(models.Model):
     def __str__(self):
         return f"{self.chapter.name} - {self.month_year}"
 
+    def save(self, *args, **kwargs):
+        deferred = self.get_deferred_fields()
+        update_fields = kwargs.get('update_fields')
+        flag_fields = []
+        for data_field, flag_field in self.MATRIX_FLAGS.items():
+            if data_field in deferred:
+                continue
+            setattr(self, flag_field, bool(getattr(self, data_field)))
+            flag_fields.append(flag_field)
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {
+                flag for data_field, flag in self.MATRIX_FLAGS.items()
+                if data_field in update_fields and flag in flag_fields
+            }
+        super().save(*args, **kwargs)
+
 
 class MemberMonthlyStats(models.Model):
     """Individual member statistics for each monthly report."""
@@ -61,12 +88,23 @@ class MemberMonthlyStats(models.Model):
     def __str__(self):
         return f"{self.member.full_name} - {self.monthly_report.month_year}"
 
-    def calculate_missing_lists(self, all_chapter_members):
-        """Calculate the missing interaction lists for this member."""
+    def calculate_missing_lists(self, all_chapter_members=None):
+        """
+        Calculate the missing interaction lists for this member.
+
+        Compares against all_chapter_members when given, otherwise against
+        the chapter's cached active member IDs.
+        """
         from analytics.models import Referral, OneToOne
+        from bni.services.chapter_service import ChapterService
 
         # Get all chapter member IDs except self
-        other_member_ids = set(all_chapter_members.exclude(id=self.member.id).values_list('id', flat=True))
+        if all_chapter_members is None:
+            other_member_ids = set(
+                ChapterService.get_active_member_ids(self.member.chapter_id)
+            ) - {self.member.id}
+        else:
+            other_member_ids = set(all_chapter_members.exclude(id=self.member.id).values_list('id', flat=True))
 
         # Get interactions
         referrals_given = set(Referral.objects.filter(
@@ -1,13 +1,24 @@
 """
 MonthlyReport ViewSet - RESTful API for Monthly Report management
 """
-from django.http import HttpResponse
-from django.db.models import Count, Sum
+from collections import Counter
+from operator import itemgetter
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags, quote_etag
+from django.views.decorators.http import etag
+from django.db.models import Count, Max, Sum
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule
 from openpyxl.styles import Font, Alignment, PatternFill
 from io import BytesIO
 
@@ -15,6 +26,47 @@ from chapters.models import Chapter
 from members.models import Member
 from reports.models import MonthlyReport, MemberMonthlyStats
 from analytics.models import TYFCB
+from bni.renderers import ORJSONRenderer
+from bni.services.chapter_service import ChapterService
+
+# Only used with a shared cache: per-process LocMem is small and holds the hot
+# member and analytics keys, which whole workbooks would evict
+MATRICES_XLSX_CACHE_TIMEOUT = 60 * 60 * 24  # seconds
+TYFCB_DATA_CACHE_MAX_AGE = 60 * 5  # seconds
+
+# Matrix export styles, shared by reference across every cell and workbook
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+ROW_HEADER_FONT = Font(bold=True)
+ROW_HEADER_FILL = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+POSITIVE_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+AGGREGATE_FILL = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
+AGGREGATE_VALUE_FILL = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+BOLD_FONT = Font(bold=True)
+TITLE_FONT = Font(bold=True, size=14)
+SECTION_FONT = Font(bold=True, size=12)
+
+
+def _reports_list_etag(request, chapter_id=None):
+    """
+    ETag for a chapter's report list.
+
+    The list only changes when a report is uploaded, (re)processed or deleted,
+    all of which move one of these aggregates.
+    """
+    stats = MonthlyReport.objects.filter(chapter_id=chapter_id).aggregate(
+        count=Count('id'), last_id=Max('id'),
+        last_uploaded=Max('uploaded_at'), last_processed=Max('processed_at')
+    )
+    if not stats['count']:
+        # Leave empty/unknown chapters unconditional so the 404 check still runs
+        return None
+    stamps = [
+        int(value.timestamp() * 1000000) if value else 0
+        for value in (stats['last_uploaded'], stats['last_processed'])
+    ]
+    return f"{chapter_id}-{stats['count']}-{stats['last_id']}-{stamps[0]}-{stamps[1]}"
 
 
 class MonthlyReportViewSet(viewsets.ModelViewSet):
@@ -30,57 +82,71 @@ class MonthlyReportViewSet(viewsets.ModelViewSet):
     queryset = MonthlyReport.objects.all()
     permission_classes = [AllowAny]  # TODO: Add proper authentication
 
+    @method_decorator(etag(_reports_list_etag))
     def list(self, request, chapter_id=None):
         """
         Get all monthly reports for a specific chapter.
 
+        Supports conditional GET: unchanged lists are answered with 304.
+
         Returns list of monthly reports with metadata including:
         - Report IDs and dates
         - File information
         - Matrix availability flags
         """
         try:
-            chapter = Chapter.objects.get(id=chapter_id)
-            monthly_reports = MonthlyReport.objects.filter(chapter=chapter).order_by('-month_year')
+            # Matrix availability comes from the denormalized flag columns,
+            # so the JSON blobs are never loaded
+            monthly_reports = MonthlyReport.objects.filter(chapter_id=chapter_id).values(
+                'id', 'month_year', 'uploaded_at', 'processed_at',
+                'slip_audit_file', 'member_names_file',
+                'has_referral_matrix', 'has_oto_matrix', 'has_combination_matrix'
+            ).order_by('-month_year')
 
             result = []
-            for report in monthly_reports:
-                try:
-                    # Safely access file fields (they are strings, not actual files)
-                    slip_file = str(report.slip_audit_file) if report.slip_audit_file else None
-                    member_file = str(report.member_names_file) if report.member_names_file else None
-
-                    result.append({
-                        'id': report.id,
-                        'month_year': report.month_year,
-                        'uploaded_at': report.uploaded_at.isoformat() if report.uploaded_at else None,
-                        'processed_at': report.processed_at.isoformat() if report.processed_at else None,
-                        'slip_audit_file': slip_file,
-                        'member_names_file': member_file,
-                        'has_referral_matrix': bool(report.referral_matrix_data),
-                        'has_oto_matrix': bool(report.oto_matrix_data),
-                        'has_combination_matrix': bool(report.combination_matrix_data)
-                    })
-                except Exception as e:
-                    # Log the error but continue processing other reports
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Error processing report {report.id}: {str(e)}")
-                    continue
+            for report in monthly_reports.iterator(chunk_size=100):
+                uploaded_at = report['uploaded_at']
+                processed_at = report['processed_at']
+                result.append({
+                    'id': report['id'],
+                    'month_year': report['month_year'],
+                    'uploaded_at': uploaded_at.isoformat() if uploaded_at else None,
+                    'processed_at': processed_at.isoformat() if processed_at else None,
+                    'slip_audit_file': report['slip_audit_file'] or None,
+                    'member_names_file': report['member_names_file'] or None,
+                    'has_referral_matrix': report['has_referral_matrix'],
+                    'has_oto_matrix': report['has_oto_matrix'],
+                    'has_combination_matrix': report['has_combination_matrix']
+                })
+
+            # Only an empty result needs the chapter existence check
+            if not result and not Chapter.objects.filter(id=chapter_id).exists():
+                return Response(
+                    {'error': 'Chapter not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
 
             return Response(result)
 
-        except Chapter.DoesNotExist:
-            return Response(
-                {'error': 'Chapter not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
         except Exception as e:
             return Response(
                 {'error': f'Monthly reports retrieval failed: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @staticmethod
+    def _report_not_found(chapter_id):
+        """404 response distinguishing a missing chapter from a missing report."""
+        if not Chapter.objects.filter(id=chapter_id).exists():
+            return Response(
+                {'error': 'Chapter not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(
+            {'error': 'Monthly report not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
     def destroy(self, request, pk=None, chapter_id=None):
         """
         Delete a monthly report.
@@ -95,15 +161,14 @@ class MonthlyReportViewSet(viewsets.ModelViewSet):
         #     )
 
         try:
-            chapter = Chapter.objects.get(id=chapter_id)
-            monthly_report = MonthlyReport.objects.get(id=pk, chapter=chapter)
+            monthly_report = MonthlyReport.objects.only('id').get(id=pk, chapter_id=chapter_id)
 
             # Delete the report (files are just filenames stored as strings, no actual files to delete)
             monthly_report.delete()
 
             return Response({'message': 'Monthly report deleted successfully'})
 
-        except (Chapter.DoesNotExist, MonthlyReport.DoesNotExist):
+        except MonthlyReport.DoesNotExist:
             return Response(
                 {'error': 'Chapter or monthly report not found'},
                 status=status.HTTP_404_NOT_FOUND
@@ -127,22 +192,43 @@ class MonthlyReportViewSet(viewsets.ModelViewSet):
         - Priority connections (members appearing in multiple missing lists)
         """
         try:
-            chapter = Chapter.objects.get(id=chapter_id)
-            monthly_report = MonthlyReport.objects.get(id=pk, chapter=chapter)
-            member = Member.objects.get(id=member_id, chapter=chapter)
-
-            try:
-                member_stats = MemberMonthlyStats.objects.get(
-                    member=member,
-                    monthly_report=monthly_report
-                )
-            except MemberMonthlyStats.DoesNotExist:
+            # Stats, member and report in one query (matrix JSON is not needed here)
+            member_stats = MemberMonthlyStats.objects.select_related(
+                'member', 'monthly_report'
+            ).defer(
+                'monthly_report__referral_matrix_data',
+                'monthly_report__oto_matrix_data',
+                'monthly_report__combination_matrix_data',
+                'monthly_report__tyfcb_inside_data',
+                'monthly_report__tyfcb_outside_data'
+            ).filter(
+                member_id=member_id,
+                monthly_report_id=pk,
+                member__chapter_id=chapter_id,
+                monthly_report__chapter_id=chapter_id
+            ).first()
+
+            if member_stats:
+                member = member_stats.member
+                monthly_report = member_stats.monthly_report
+            else:
                 # If no stats exist, return basic member info with empty lists
-                member_stats = None
+                monthly_report = MonthlyReport.objects.only(
+                    'id', 'month_year', 'processed_at'
+                ).get(id=pk, chapter_id=chapter_id)
+                member = Member.objects.get(id=member_id, chapter_id=chapter_id)
 
             # Get all chapter members for name resolution
-            chapter_members = Member.objects.filter(chapter=chapter, is_active=True)
-            member_lookup = {m.id: m.full_name for m in chapter_members}
+            member_lookup = ChapterService.get_active_member_names(chapter_id)
+
+            def resolve(member_ids):
+                """Map member IDs to id/name dicts, skipping members not in the chapter roster."""
+                lookup = member_lookup.get
+                return [
+                    {'id': member_id, 'name': name}
+                    for member_id in member_ids
+                    if (name := lookup(member_id)) is not None
+                ]
 
             result = {
                 'member': {
@@ -163,38 +249,14 @@ class MonthlyReportViewSet(viewsets.ModelViewSet):
                     'tyfcb_outside_amount': float(member_stats.tyfcb_outside_amount) if member_stats else 0.0
                 },
                 'missing_interactions': {
-                    'missing_otos': [
-                        {
-                            'id': member_id,
-                            'name': member_lookup.get(member_id, 'Unknown')
-                        }
-                        for member_id in (member_stats.missing_otos if member_stats else [])
-                        if member_id in member_lookup
-                    ],
-                    'missing_referrals_given_to': [
-                        {
-                            'id': member_id,
-                            'name': member_lookup.get(member_id, 'Unknown')
-                        }
-                        for member_id in (member_stats.missing_referrals_given_to if member_stats else [])
-                        if member_id in member_lookup
-                    ],
-                    'missing_referrals_received_from': [
-                        {
-                            'id': member_id,
-                            'name': member_lookup.get(member_id, 'Unknown')
-                        }
-                        for member_id in (member_stats.missing_referrals_received_from if member_stats else [])
-                        if member_id in member_lookup
-                    ],
-                    'priority_connections': [
-                        {
-                            'id': member_id,
-                            'name': member_lookup.get(member_id, 'Unknown')
-                        }
-                        for member_id in (member_stats.priority_connections if member_stats else [])
-                        if member_id in member_lookup
-                    ]
+                    'missing_otos': resolve(member_stats.missing_otos if member_stats else []),
+                    'missing_referrals_given_to': resolve(
+                        member_stats.missing_referrals_given_to if member_stats else []
+                    ),
+                    'missing_referrals_received_from': resolve(
+                        member_stats.missing_referrals_received_from if member_stats else []
+                    ),
+                    'priority_connections': resolve(member_stats.priority_connections if member_stats else [])
                 },
                 'monthly_report': {
                     'id': monthly_report.id,
@@ -205,7 +267,7 @@ class MonthlyReportViewSet(viewsets.ModelViewSet):
 
             return Response(result)
 
-        except (Chapter.DoesNotExist, MonthlyReport.DoesNotExist, Member.DoesNotExist):
+        except (MonthlyReport.DoesNotExist, Member.DoesNotExist):
             return Response(
                 {'error': 'Chapter, monthly report, or member not found'},
                 status=status.HTTP_404_NOT_FOUND
@@ -224,34 +286,201 @@ class MonthlyReportViewSet(viewsets.ModelViewSet):
         Returns inside and outside TYFCB data with totals and per-member breakdowns.
         """
         try:
-            chapter = Chapter.objects.get(id=chapter_id)
-            monthly_report = MonthlyReport.objects.get(id=pk, chapter=chapter)
-
+            report = MonthlyReport.objects.filter(id=pk, chapter_id=chapter_id).values(
+                'month_year', 'processed_at', 'tyfcb_inside_data', 'tyfcb_outside_data'
+            ).first()
+            if report is None:
+                return self._report_not_found(chapter_id)
+
+            # Report data only changes when the report is reprocessed, so
+            # processed_at is enough to validate a client's cached copy
+            report_etag = None
+            if report['processed_at'] is not None:
+                # Microseconds, so a reprocess within the same second still changes it
+                processed_stamp = int(report['processed_at'].timestamp() * 1000000)
+                report_etag = quote_etag(f"{pk}-{processed_stamp}")
+                # GZipMiddleware weakens the ETag, so compare ignoring the W/ prefix
+                client_etags = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+                if report_etag in (tag.removeprefix('W/') for tag in client_etags):
+                    return HttpResponseNotModified(headers={'ETag': report_etag})
+
+            empty_tyfcb = {'total_amount': 0, 'count': 0, 'by_member': {}}
             tyfcb_data = {
-                'inside': monthly_report.tyfcb_inside_data or {'total_amount': 0, 'count': 0, 'by_member': {}},
-                'outside': monthly_report.tyfcb_outside_data or {'total_amount': 0, 'count': 0, 'by_member': {}},
-                'month_year': monthly_report.month_year,
-                'processed_at': monthly_report.processed_at
+                'inside': report['tyfcb_inside_data'] or empty_tyfcb,
+                'outside': report['tyfcb_outside_data'] or empty_tyfcb,
+                'month_year': report['month_year'],
+                'processed_at': report['processed_at']
             }
 
-            return Response(tyfcb_data)
-
-        except Chapter.DoesNotExist:
-            return Response(
-                {'error': 'Chapter not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except MonthlyReport.DoesNotExist:
-            return Response(
-                {'error': 'Monthly report not found'},
-                status=status.HTTP_404_NOT_FOUND
+            # Render directly instead of going through DRF's Response/negotiation
+            response = HttpResponse(
+                ORJSONRenderer().render(tyfcb_data),
+                content_type=ORJSONRenderer.media_type
             )
+            if report_etag:
+                response['ETag'] = report_etag
+            patch_cache_control(response, private=True, max_age=TYFCB_DATA_CACHE_MAX_AGE)
+            return response
+
         except Exception as e:
             return Response(
                 {'error': f'Failed to get TYFCB data: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @staticmethod
+    def _build_matrices_workbook(monthly_report):
+        """Build the matrices workbook for a report and return the .xlsx bytes."""
+        # Create a new write-only workbook (rows are streamed, no Cell grid in memory)
+        wb = openpyxl.Workbook(write_only=True)
+
+        def styled_cell(ws, value, font=None, fill=None, alignment=None):
+            cell = WriteOnlyCell(ws, value=value)
+            if font is not None:
+                cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            if alignment is not None:
+                cell.alignment = alignment
+            return cell
+
+        # Helper function to create matrix sheet
+        def create_matrix_sheet(sheet_name, matrix_data, include_aggregates=False):
+            if not matrix_data or 'members' not in matrix_data or 'matrix' not in matrix_data:
+                return None
+
+            ws = wb.create_sheet(title=sheet_name)
+            members = matrix_data['members']
+            matrix = matrix_data['matrix']  # This is a 2D list
+
+            # Column widths must be set before the first row is written
+            ws.column_dimensions['A'].width = 20
+            num_cols = len(members) + (4 if include_aggregates else 0)
+            for col_idx in range(2, num_cols + 2):
+                ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = 15
+
+            # Write header row
+            header_row = [styled_cell(ws, "From \\ To", HEADER_FONT, HEADER_FILL, CENTER_ALIGN)]
+            header_row.extend(
+                styled_cell(ws, member, HEADER_FONT, HEADER_FILL, CENTER_ALIGN)
+                for member in members
+            )
+
+            # Add aggregate column headers for combination matrix
+            if include_aggregates:
+                aggregate_headers = ["Neither", "OTO Only", "Referral Only", "Both"]
+                header_row.extend(
+                    styled_cell(ws, header, HEADER_FONT, AGGREGATE_FILL, CENTER_ALIGN)
+                    for header in aggregate_headers
+                )
+            ws.append(header_row)
+
+            # Write data rows - matrix is a 2D list
+            for row_idx, from_member in enumerate(members):
+                # Row header
+                row_cells = [styled_cell(ws, from_member, ROW_HEADER_FONT, ROW_HEADER_FILL, CENTER_ALIGN)]
+
+                # Matrix values from the 2D list
+                row_data = matrix[row_idx] if row_idx < len(matrix) else []
+                row_cells.extend(styled_cell(ws, value, alignment=CENTER_ALIGN) for value in row_data)
+
+                # Add aggregates for combination matrix
+                if include_aggregates:
+                    # Count each type based on legend:
+                    # 0 = Neither, 1 = OTO Only, 2 = Referral Only, 3 = Both
+                    value_counts = Counter(row_data)
+
+                    # Aggregate values always start right after the member columns
+                    row_cells.extend([None] * (len(members) - len(row_data)))
+                    aggregate_values = [value_counts[0], value_counts[1], value_counts[2], value_counts[3]]
+                    row_cells.extend(
+                        styled_cell(ws, value, BOLD_FONT, AGGREGATE_VALUE_FILL, CENTER_ALIGN)
+                        for value in aggregate_values
+                    )
+
+                ws.append(row_cells)
+
+            # Color code positive values with one conditional format for the
+            # whole matrix instead of a fill on every cell
+            if members:
+                last_col = openpyxl.utils.get_column_letter(len(members) + 1)
+                ws.conditional_formatting.add(
+                    f"B2:{last_col}{len(members) + 1}",
+                    CellIsRule(operator='greaterThan', formula=['0'], fill=POSITIVE_FILL)
+                )
+            return ws
+
+        # Helper function to write one TYFCB section (totals + member breakdown)
+        def write_tyfcb_section(ws, title, tyfcb_data):
+            ws.append([styled_cell(ws, title, SECTION_FONT, HEADER_FILL)])
+            ws.append([
+                styled_cell(ws, f"Total Amount: AED {tyfcb_data.get('total_amount', 0):,.2f}", BOLD_FONT),
+                None,
+                styled_cell(ws, f"Total TYFCBs: {tyfcb_data.get('count', 0)}", BOLD_FONT),
+            ])
+            ws.append([])
+
+            # By member breakdown - use data from JSON field
+            ws.append([
+                styled_cell(ws, "Member", HEADER_FONT, HEADER_FILL),
+                styled_cell(ws, "Amount (AED)", HEADER_FONT, HEADER_FILL),
+            ])
+
+            # Only show members with TYFCB, sorted by amount (descending)
+            by_member = tyfcb_data.get('by_member', {})
+            sorted_members = sorted(
+                (item for item in by_member.items() if item[1] > 0),
+                key=itemgetter(1), reverse=True
+            )
+
+            for member_name, amount in sorted_members:
+                ws.append([member_name, f"{float(amount):,.2f}"])
+
+        # Create sheets for each matrix type
+        if monthly_report.referral_matrix_data:
+            create_matrix_sheet("Referral Matrix", monthly_report.referral_matrix_data)
+
+        if monthly_report.oto_matrix_data:
+            create_matrix_sheet("One-to-One Matrix", monthly_report.oto_matrix_data)
+
+        if monthly_report.combination_matrix_data:
+            create_matrix_sheet("Combination Matrix", monthly_report.combination_matrix_data, include_aggregates=True)
+
+        # Create TYFCB sheet
+        if monthly_report.tyfcb_inside_data or monthly_report.tyfcb_outside_data:
+            ws_tyfcb = wb.create_sheet("TYFCB Report")
+
+            # Set column widths
+            ws_tyfcb.column_dimensions['A'].width = 30
+            ws_tyfcb.column_dimensions['B'].width = 20
+            ws_tyfcb.column_dimensions['C'].width = 15
+            ws_tyfcb.column_dimensions['D'].width = 15
+
+            # Header
+            ws_tyfcb.append([styled_cell(ws_tyfcb, "TYFCB Report", TITLE_FONT)])
+            ws_tyfcb.merged_cells.add('A1:D1')
+            ws_tyfcb.append([])
+
+            # Inside Chapter TYFCB
+            if monthly_report.tyfcb_inside_data:
+                write_tyfcb_section(ws_tyfcb, "Within Chapter", monthly_report.tyfcb_inside_data)
+                ws_tyfcb.append([])
+                ws_tyfcb.append([])
+
+            # Outside Chapter TYFCB
+            if monthly_report.tyfcb_outside_data:
+                write_tyfcb_section(ws_tyfcb, "Outside Chapter", monthly_report.tyfcb_outside_data)
+
+        # If no matrices were created, add an info sheet
+        if len(wb.sheetnames) == 0:
+            ws = wb.create_sheet("Info")
+            ws.append([styled_cell(ws, "No matrix data available for this report", BOLD_FONT)])
+
+        # Save to BytesIO
+        output = BytesIO()
+        wb.save(output)
+        return output.getvalue()
+
     @action(detail=True, methods=['get'], url_path='download-matrices')
     def download_matrices(self, request, pk=None, chapter_id=None):
         """
@@ -263,209 +492,32 @@ class MonthlyReportViewSet(viewsets.ModelViewSet):
         - Combination Matrix
         """
         try:
-            chapter = Chapter.objects.get(id=chapter_id)
-            monthly_report = MonthlyReport.objects.get(id=pk, chapter=chapter)
-
-            # Create a new workbook
-            wb = openpyxl.Workbook()
-            wb.remove(wb.active)  # Remove default sheet
-
-            # Header styling
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF")
-            center_align = Alignment(horizontal="center", vertical="center")
-
-            # Helper function to create matrix sheet
-            def create_matrix_sheet(sheet_name, matrix_data, include_aggregates=False):
-                if not matrix_data or 'members' not in matrix_data or 'matrix' not in matrix_data:
-                    return None
-
-                ws = wb.create_sheet(title=sheet_name)
-                members = matrix_data['members']
-                matrix = matrix_data['matrix']  # This is a 2D list
-
-                # Determine header columns
-                num_cols = len(members) + (4 if include_aggregates else 0)
-
-                # Write header row
-                ws.cell(1, 1, "From \\ To").font = header_font
-                ws.cell(1, 1).fill = header_fill
-                ws.cell(1, 1).alignment = center_align
-
-                for col_idx, member in enumerate(members, start=2):
-                    cell = ws.cell(1, col_idx, member)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = center_align
-                    ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = 15
-
-                # Add aggregate column headers for combination matrix
-                if include_aggregates:
-                    aggregate_headers = ["Neither", "OTO Only", "Referral Only", "Both"]
-                    aggregate_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-                    for idx, header in enumerate(aggregate_headers):
-                        col = len(members) + 2 + idx
-                        cell = ws.cell(1, col, header)
-                        cell.font = header_font
-                        cell.fill = aggregate_fill
-                        cell.alignment = center_align
-                        ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 15
-
-                # Write data rows - matrix is a 2D list
-                for row_idx, from_member in enumerate(members):
-                    # Row header
-                    cell = ws.cell(row_idx + 2, 1, from_member)
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-                    cell.alignment = center_align
-
-                    # Matrix values from the 2D list
-                    row_total_given = 0
-                    if row_idx < len(matrix):
-                        row_data = matrix[row_idx]
-                        for col_idx, value in enumerate(row_data):
-                            cell = ws.cell(row_idx + 2, col_idx + 2, value)
-                            cell.alignment = center_align
-                            row_total_given += value if isinstance(value, (int, float)) else 0
-
-                            # Color coding for values
-                            if value > 0:
-                                cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-
-                    # Add aggregates for combination matrix
-                    if include_aggregates:
-                        # Count each type based on legend:
-                        # 0 = Neither, 1 = OTO Only, 2 = Referral Only, 3 = Both
-                        row_data = matrix[row_idx] if row_idx < len(matrix) else []
-
-                        neither_count = sum(1 for v in row_data if v == 0)
-                        oto_only_count = sum(1 for v in row_data if v == 1)
-                        ref_only_count = sum(1 for v in row_data if v == 2)
-                        both_count = sum(1 for v in row_data if v == 3)
-
-                        # Write aggregate values
-                        aggregate_values = [neither_count, oto_only_count, ref_only_count, both_count]
-                        for idx, value in enumerate(aggregate_values):
-                            col = len(members) + 2 + idx
-                            cell = ws.cell(row_idx + 2, col, value)
-                            cell.alignment = center_align
-                            cell.font = Font(bold=True)
-                            cell.fill = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-
-                ws.column_dimensions['A'].width = 20
-                return ws
-
-            # Create sheets for each matrix type
-            if monthly_report.referral_matrix_data:
-                create_matrix_sheet("Referral Matrix", monthly_report.referral_matrix_data)
-
-            if monthly_report.oto_matrix_data:
-                create_matrix_sheet("One-to-One Matrix", monthly_report.oto_matrix_data)
-
-            if monthly_report.combination_matrix_data:
-                create_matrix_sheet("Combination Matrix", monthly_report.combination_matrix_data, include_aggregates=True)
-
-            # Create TYFCB sheet
-            if monthly_report.tyfcb_inside_data or monthly_report.tyfcb_outside_data:
-                ws_tyfcb = wb.create_sheet("TYFCB Report")
-
-                # Header
-                ws_tyfcb.cell(1, 1, "TYFCB Report").font = Font(bold=True, size=14)
-                ws_tyfcb.merge_cells('A1:D1')
-
-                row = 3
-                # Inside Chapter TYFCB
-                if monthly_report.tyfcb_inside_data:
-                    inside = monthly_report.tyfcb_inside_data
-                    ws_tyfcb.cell(row, 1, "Within Chapter").font = Font(bold=True, size=12)
-                    ws_tyfcb.cell(row, 1).fill = header_fill
-                    row += 1
-                    ws_tyfcb.cell(row, 1, f"Total Amount: AED {inside.get('total_amount', 0):,.2f}").font = Font(bold=True)
-                    ws_tyfcb.cell(row, 3, f"Total TYFCBs: {inside.get('count', 0)}").font = Font(bold=True)
-                    row += 2
-
-                    # By member breakdown - use data from JSON field
-                    ws_tyfcb.cell(row, 1, "Member").font = header_font
-                    ws_tyfcb.cell(row, 1).fill = header_fill
-                    ws_tyfcb.cell(row, 2, "Amount (AED)").font = header_font
-                    ws_tyfcb.cell(row, 2).fill = header_fill
-                    row += 1
-
-                    # Get by_member data and sort by amount (descending)
-                    by_member = inside.get('by_member', {})
-                    sorted_members = sorted(by_member.items(), key=lambda x: x[1], reverse=True)
-
-                    for member_name, amount in sorted_members:
-                        if amount > 0:  # Only show members with TYFCB
-                            ws_tyfcb.cell(row, 1, member_name)
-                            ws_tyfcb.cell(row, 2, f"{float(amount):,.2f}")
-                            row += 1
-
-                    row += 2
-
-                # Outside Chapter TYFCB
-                if monthly_report.tyfcb_outside_data:
-                    outside = monthly_report.tyfcb_outside_data
-                    ws_tyfcb.cell(row, 1, "Outside Chapter").font = Font(bold=True, size=12)
-                    ws_tyfcb.cell(row, 1).fill = header_fill
-                    row += 1
-                    ws_tyfcb.cell(row, 1, f"Total Amount: AED {outside.get('total_amount', 0):,.2f}").font = Font(bold=True)
-                    ws_tyfcb.cell(row, 3, f"Total TYFCBs: {outside.get('count', 0)}").font = Font(bold=True)
-                    row += 2
-
-                    # By member breakdown - use data from JSON field
-                    ws_tyfcb.cell(row, 1, "Member").font = header_font
-                    ws_tyfcb.cell(row, 1).fill = header_fill
-                    ws_tyfcb.cell(row, 2, "Amount (AED)").font = header_font
-                    ws_tyfcb.cell(row, 2).fill = header_fill
-                    row += 1
-
-                    # Get by_member data and sort by amount (descending)
-                    by_member = outside.get('by_member', {})
-                    sorted_members = sorted(by_member.items(), key=lambda x: x[1], reverse=True)
-
-                    for member_name, amount in sorted_members:
-                        if amount > 0:  # Only show members with TYFCB
-                            ws_tyfcb.cell(row, 1, member_name)
-                            ws_tyfcb.cell(row, 2, f"{float(amount):,.2f}")
-                            row += 1
-
-                # Set column widths
-                ws_tyfcb.column_dimensions['A'].width = 30
-                ws_tyfcb.column_dimensions['B'].width = 20
-                ws_tyfcb.column_dimensions['C'].width = 15
-                ws_tyfcb.column_dimensions['D'].width = 15
-
-            # If no matrices were created, add an info sheet
-            if len(wb.sheetnames) == 0:
-                ws = wb.create_sheet("Info")
-                ws['A1'] = "No matrix data available for this report"
-                ws['A1'].font = Font(bold=True)
-
-            # Save to BytesIO
-            output = BytesIO()
-            wb.save(output)
-            output.seek(0)
+            report_meta = MonthlyReport.objects.select_related('chapter').only(
+                'id', 'month_year', 'uploaded_at', 'processed_at', 'chapter__name'
+            ).get(id=pk, chapter_id=chapter_id)
+
+            # Matrices only change when a report is (re)processed
+            processed_stamp = report_meta.processed_at.timestamp() if report_meta.processed_at else 'none'
+            cache_key = f"matrices:xlsx:{report_meta.id}:{report_meta.uploaded_at.timestamp()}:{processed_stamp}"
+            cache_workbook = not isinstance(caches['default'], LocMemCache)
+            content = cache.get(cache_key) if cache_workbook else None
+            if content is None:
+                monthly_report = MonthlyReport.objects.get(id=report_meta.id)
+                content = self._build_matrices_workbook(monthly_report)
+                if cache_workbook:
+                    cache.set(cache_key, content, MATRICES_XLSX_CACHE_TIMEOUT)
 
             # Create HTTP response
-            filename = f"{chapter.name.replace(' ', '_')}_Matrices_{monthly_report.month_year}.xlsx"
+            filename = f"{report_meta.chapter.name.replace(' ', '_')}_Matrices_{report_meta.month_year}.xlsx"
             response = HttpResponse(
-                output.read(),
+                content,
                 content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
             )
             response['Content-Disposition'] = f'attachment; filename="{filename}"'
             return response
 
-        except Chapter.DoesNotExist:
-            return Response(
-                {'error': 'Chapter not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
         except MonthlyReport.DoesNotExist:
-            return Response(
-                {'error': 'Monthly report not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+            return self._report_not_found(chapter_id)
         except Exception as e:
             return Response(
                 {'error': f'Failed to generate Excel file: {str(e)}'},
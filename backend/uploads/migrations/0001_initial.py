@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('reports', '0002_monthlyreport_matrix_flags'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadedFileHash',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(help_text='SHA-256 over the slip audit and member names files', max_length=64)),
+                ('result', models.JSONField(default=dict, help_text='Processing result returned for the original upload')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('monthly_report', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='upload_hash', to='reports.monthlyreport')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['sha256'], name='upload_hash_sha256_idx')],
+            },
+        ),
+    ]
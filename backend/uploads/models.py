@@ -1,3 +1,26 @@
+"""
+Upload models for BNI Analytics.
+"""
 from django.db import models
+from reports.models import MonthlyReport
 
-# Create your models here.
+
+class UploadedFileHash(models.Model):
+    """
+    Content hash of the files a monthly report was processed from.
+
+    Lets an identical re-upload return the stored result instead of parsing
+    the Excel files again. Rows go away with their report.
+    """
+    monthly_report = models.OneToOneField(MonthlyReport, on_delete=models.CASCADE, related_name='upload_hash')
+    sha256 = models.CharField(max_length=64, help_text="SHA-256 over the slip audit and member names files")
+    result = models.JSONField(default=dict, help_text="Processing result returned for the original upload")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['sha256'], name='upload_hash_sha256_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.monthly_report} - {self.sha256[:12]}"
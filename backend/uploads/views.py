@@ -1,9 +1,11 @@
 """
 File Upload ViewSet - RESTful API for Excel file uploads
 """
+import hashlib
 import logging
 import re
 from datetime import datetime
+from django.db import connection, transaction
 from rest_framework import viewsets, status, serializers
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
@@ -11,11 +13,44 @@ from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 
 from chapters.models import Chapter
+from uploads.models import UploadedFileHash
 from bni.services.excel_processor import ExcelProcessorService
 from bni.services.bulk_upload_service import BulkUploadService
+from bni.services.chapter_service import ChapterService
+from bni.services.member_analytics_service import MemberAnalyticsService
 
 logger = logging.getLogger(__name__)
 
+EXCEL_EXTENSIONS = ('.xls', '.xlsx')
+
+# Report dates embedded in slip audit filenames (day is matched but not captured)
+_FILENAME_YMD_RE = re.compile(r'(\d{4})-(\d{2})-(?:\d{2})')
+_FILENAME_MDY_RE = re.compile(r'(\d{2})-(?:\d{2})-(\d{4})')
+
+
+def _is_excel_filename(filename):
+    """Check a filename's extension (case-insensitive) against EXCEL_EXTENSIONS."""
+    return filename.lower().endswith(EXCEL_EXTENSIONS)
+
+
+def _upload_digest(slip_audit_files, member_names_file):
+    """SHA-256 over the contents of an upload's slip audit and member names files."""
+    digest = hashlib.sha256()
+    for uploaded_file in [*slip_audit_files, member_names_file]:
+        file_hash = hashlib.sha256()
+        if uploaded_file is not None:
+            for chunk in uploaded_file.chunks():
+                file_hash.update(chunk)
+        digest.update(file_hash.digest())
+    return digest.hexdigest()
+
+
+def _invalidate_chapter_caches(chapter_ids):
+    """Drop the per-chapter member and analytics caches for the given chapters."""
+    for chapter_id in chapter_ids:
+        ChapterService.invalidate_member_caches(chapter_id)
+        MemberAnalyticsService.invalidate_chapter(chapter_id)
+
 
 class FileUploadSerializer(serializers.Serializer):
     """Serializer for file upload validation."""
@@ -52,17 +87,15 @@ class FileUploadViewSet(viewsets.ViewSet):
         Returns month_year in format 'YYYY-MM' or None if not found
         """
         # Try YYYY-MM-DD format first (e.g., 2025-01-28)
-        pattern_ymd = r'(\d{4})-(\d{2})-(\d{2})'
-        match = re.search(pattern_ymd, filename)
+        match = _FILENAME_YMD_RE.search(filename)
         if match:
-            year, month, day = match.groups()
+            year, month = match.groups()
             return f"{year}-{month}"
 
         # Try MM-DD-YYYY format (e.g., 08-25-2025)
-        pattern_mdy = r'(\d{2})-(\d{2})-(\d{4})'
-        match = re.search(pattern_mdy, filename)
+        match = _FILENAME_MDY_RE.search(filename)
         if match:
-            month, day, year = match.groups()
+            month, year = match.groups()
             return f"{year}-{month}"
 
         return None
@@ -81,8 +114,15 @@ class FileUploadViewSet(viewsets.ViewSet):
 
         Returns processing result with created records and any errors.
         """
+        # Files can only arrive as multipart; reject anything else before parsing
+        if not request.content_type.startswith('multipart/form-data'):
+            return Response(
+                {'error': 'Expected a multipart/form-data upload'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+
         # Log incoming request for debugging
-        logger.info(f"Excel upload request - Files: {list(request.FILES.keys())}, Data: {list(request.data.keys())}")
+        logger.info("Excel upload request - Files: %s, Data: %s", list(request.FILES.keys()), list(request.data.keys()))
 
         # Handle both new (slip_audit_files) and old (slip_audit_file) format
         slip_files = request.FILES.getlist('slip_audit_files')
@@ -98,7 +138,8 @@ class FileUploadViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        logger.info(f"Found {len(slip_files)} slip audit file(s): {[f.name for f in slip_files]}")
+        slip_names = [f.name for f in slip_files]
+        logger.info("Found %d slip audit file(s): %s", len(slip_files), slip_names)
 
         # Get other data from request directly (skip serializer for file lists)
         try:
@@ -123,23 +164,22 @@ class FileUploadViewSet(viewsets.ViewSet):
 
         try:
 
-            logger.info(f"Processing {len(slip_audit_files)} slip audit file(s)")
+            logger.info("Processing %d slip audit file(s)", len(slip_audit_files))
 
             # If month_year not provided, try to extract from first filename (optional, non-blocking)
             if not month_year:
-                extracted_date = self._extract_date_from_filename(slip_audit_files[0].name)
+                extracted_date = self._extract_date_from_filename(slip_names[0])
                 if extracted_date:
                     month_year = extracted_date
-                    logger.info(f"Extracted date from filename: {month_year}")
+                    logger.info("Extracted date from filename: %s", month_year)
                 else:
                     # Use current month as default if extraction fails
-                    from datetime import datetime
                     month_year = datetime.now().strftime('%Y-%m')
-                    logger.info(f"Using current month as default: {month_year}")
+                    logger.info("Using current month as default: %s", month_year)
 
             # Validate chapter access
             try:
-                chapter = Chapter.objects.get(id=chapter_id)
+                chapter = Chapter.objects.only('id', 'name').get(id=chapter_id)
                 # Add permission check here if needed
             except Chapter.DoesNotExist:
                 return Response(
@@ -148,22 +188,34 @@ class FileUploadViewSet(viewsets.ViewSet):
                 )
 
             # Validate file types
-            for slip_file in slip_audit_files:
-                if not slip_file.name.lower().endswith(('.xls', '.xlsx')):
+            for slip_name in slip_names:
+                if not _is_excel_filename(slip_name):
                     return Response(
-                        {'error': f'Only .xls and .xlsx files are supported. Invalid file: {slip_file.name}'},
+                        {'error': f'Only .xls and .xlsx files are supported. Invalid file: {slip_name}'},
                         status=status.HTTP_400_BAD_REQUEST
                     )
 
-            if member_names_file and not member_names_file.name.lower().endswith(('.xls', '.xlsx')):
+            if member_names_file and not _is_excel_filename(member_names_file.name):
                 return Response(
                     {'error': 'Only .xls and .xlsx files are supported for member names file'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
             # Process using the new monthly report method
-            logger.info(f"Starting Excel processing for chapter {chapter.name}, month {month_year}")
-            logger.info(f"Processing {len(slip_audit_files)} slip audit files: {[f.name for f in slip_audit_files]}")
+            logger.info("Starting Excel processing for chapter %s, month %s", chapter.name, month_year)
+            logger.info("Processing %d slip audit files: %s", len(slip_audit_files), slip_names)
+
+            # An identical re-upload for the same report returns the stored result
+            upload_hash = _upload_digest(slip_audit_files, member_names_file)
+            previous_result = UploadedFileHash.objects.filter(
+                monthly_report__chapter_id=chapter.id,
+                monthly_report__month_year=month_year,
+                sha256=upload_hash
+            ).values_list('result', flat=True).first()
+            if previous_result is not None:
+                logger.info("Skipping processing: files already processed for %s", month_year)
+                return Response({**previous_result, 'duplicate_upload': True}, status=status.HTTP_200_OK)
+
             processor = ExcelProcessorService(chapter)
 
             try:
@@ -173,24 +225,29 @@ class FileUploadViewSet(viewsets.ViewSet):
                     month_year=month_year
                 )
 
-                logger.info(f"Processing complete - Success: {result.get('success')}")
+                logger.info("Processing complete - Success: %s", result.get('success'))
 
                 # Return appropriate status code based on result
                 if result.get('success'):
+                    UploadedFileHash.objects.create(
+                        monthly_report_id=result['monthly_report_id'],
+                        sha256=upload_hash,
+                        result=result
+                    )
                     return Response(result, status=status.HTTP_200_OK)
                 else:
-                    logger.error(f"Processing failed: {result.get('error', 'Unknown error')}")
+                    logger.error("Processing failed: %s", result.get('error', 'Unknown error'))
                     return Response(result, status=status.HTTP_400_BAD_REQUEST)
 
             except Exception as proc_error:
-                logger.exception(f"Excel processing error: {str(proc_error)}")
+                logger.exception("Excel processing error: %s", proc_error)
                 return Response(
                     {'error': f'Excel processing failed: {str(proc_error)}', 'success': False},
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
 
         except Exception as e:
-            logger.exception(f"Upload endpoint error: {str(e)}")
+            logger.exception("Upload endpoint error: %s", e)
             return Response(
                 {'error': f'Upload failed: {str(e)}', 'success': False},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -216,7 +273,7 @@ class FileUploadViewSet(viewsets.ViewSet):
         file = request.FILES['file']
 
         # Validate file type
-        if not file.name.endswith(('.xls', '.xlsx')):
+        if not _is_excel_filename(file.name):
             return Response(
                 {'error': 'Invalid file type. Please upload .xls or .xlsx file'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -273,27 +330,43 @@ class FileUploadViewSet(viewsets.ViewSet):
             from reports.models import MonthlyReport, MemberMonthlyStats
             from analytics.models import Referral, OneToOne, TYFCB
 
-            # Count before deletion
-            counts = {
-                'chapters': Chapter.objects.count(),
-                'members': Member.objects.count(),
-                'monthly_reports': MonthlyReport.objects.count(),
-                'member_stats': MemberMonthlyStats.objects.count(),
-                'referrals': Referral.objects.count(),
-                'one_to_ones': OneToOne.objects.count(),
-                'tyfcbs': TYFCB.objects.count(),
+            models_to_reset = {
+                'chapters': Chapter,
+                'members': Member,
+                'monthly_reports': MonthlyReport,
+                'member_stats': MemberMonthlyStats,
+                'referrals': Referral,
+                'one_to_ones': OneToOne,
+                'tyfcbs': TYFCB,
             }
+            quoted_tables = [
+                connection.ops.quote_name(model._meta.db_table) for model in models_to_reset.values()
+            ]
+
+            # Count before deletion, in a single round-trip
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT ' + ', '.join(
+                    f'(SELECT COUNT(*) FROM {table})' for table in quoted_tables
+                ))
+                counts = dict(zip(models_to_reset, cursor.fetchone()))
+            chapter_ids = list(Chapter.objects.values_list('id', flat=True))
+
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    # One statement instead of collecting and deleting every row
+                    with connection.cursor() as cursor:
+                        cursor.execute(f"TRUNCATE {', '.join(quoted_tables)} RESTART IDENTITY CASCADE")
+                else:
+                    # Delete all data (cascade will handle related objects)
+                    for model in models_to_reset.values():
+                        model.objects.all().delete()
 
-            # Delete all data (cascade will handle related objects)
-            Chapter.objects.all().delete()
-            Member.objects.all().delete()
-            MonthlyReport.objects.all().delete()
-            MemberMonthlyStats.objects.all().delete()
-            Referral.objects.all().delete()
-            OneToOne.objects.all().delete()
-            TYFCB.objects.all().delete()
+                # TRUNCATE skips the signals that keep per-chapter caches in
+                # sync, and reused IDs would hit stale entries. Only this app's
+                # chapter keys are dropped; the Redis DB may be shared
+                transaction.on_commit(lambda: _invalidate_chapter_caches(chapter_ids))
 
-            logger.warning(f"Database reset performed. Deleted: {counts}")
+            logger.warning("Database reset performed. Deleted: %s", counts)
 
             return Response({
                 'success': True,
@@ -1,6 +1,7 @@
 """
 Vercel serverless function handler for Django
 """
+import logging
 import os
 from django.core.wsgi import get_wsgi_application
 
@@ -8,3 +9,15 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 # Vercel expects 'app' variable
 app = get_wsgi_application()
+
+# Warm the container at cold start rather than on the first request:
+# resolving the URLconf imports every view (and with them pandas, openpyxl
+# and the Excel processor), and the DB connection is kept for CONN_MAX_AGE
+from django.db import connection
+from django.urls import get_resolver
+
+get_resolver().url_patterns
+try:
+    connection.ensure_connection()
+except Exception:
+    logging.getLogger(__name__).warning("Database warm-up failed", exc_info=True)
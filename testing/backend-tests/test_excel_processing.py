@@ -11,12 +11,17 @@ These tests use real August 2025 BNI chapter data to validate:
 """
 
 import os
+import unittest
+from functools import lru_cache
 from pathlib import Path
 from django.test import TestCase
 from django.core.files.uploadedfile import SimpleUploadedFile
-from features.chapters.models import Chapter, Member, MonthlyReport
-from features.analytics.models import Referral, OneToOne, TYFCB
-from features.data_processing.services import ExcelProcessorService
+from django.db.models import Sum
+from chapters.models import Chapter
+from members.models import Member
+from reports.models import MonthlyReport
+from analytics.models import Referral, OneToOne, TYFCB
+from bni.services.excel_processor import ExcelProcessorService
 
 
 # Path to test data
@@ -24,13 +29,38 @@ TEST_DATA_DIR = Path(__file__).parent.parent / 'test-data' / 'august-2025'
 SLIP_AUDIT_DIR = TEST_DATA_DIR / 'slip-audit-reports'
 MEMBER_NAMES_DIR = TEST_DATA_DIR / 'member-names'
 
+CHAPTER_KEYS = (
+    'continental', 'elevate', 'energy', 'excelerate', 'givers',
+    'gladiators', 'legends', 'synergy', 'united',
+)
+CHAPTER_SLIP_DIRS = {key: SLIP_AUDIT_DIR / key for key in CHAPTER_KEYS}
+CHAPTER_MEMBER_FILES = {key: MEMBER_NAMES_DIR / f'bni-{key}.xls' for key in CHAPTER_KEYS}
+
+
+@lru_cache(maxsize=None)
+def get_slip_files(chapter_key):
+    """Slip audit files for a chapter; the test data doesn't change during a run."""
+    slip_audit_dir = CHAPTER_SLIP_DIRS[chapter_key]
+    if not slip_audit_dir.is_dir():
+        return ()
+    with os.scandir(slip_audit_dir) as entries:
+        return tuple(Path(entry.path) for entry in entries if entry.name.endswith('.xls'))
+
 
 class ExcelProcessingTestCase(TestCase):
     """Test Excel file processing with real August 2025 data."""
 
-    def setUp(self):
-        """Set up test chapters."""
-        self.chapters = {
+    @classmethod
+    def setUpClass(cls):
+        # Skip before super() so no class-level transaction or test data is set up
+        if not SLIP_AUDIT_DIR.is_dir() or not any(SLIP_AUDIT_DIR.iterdir()):
+            raise unittest.SkipTest(f"Test data not present: {SLIP_AUDIT_DIR}")
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test chapters and one processor per chapter, shared by all tests."""
+        cls.chapters = {
             'continental': Chapter.objects.create(name='BNI Continental', location='Dubai'),
             'elevate': Chapter.objects.create(name='BNI Elevate', location='Dubai'),
             'energy': Chapter.objects.create(name='BNI Energy', location='Dubai'),
@@ -41,18 +71,38 @@ class ExcelProcessingTestCase(TestCase):
             'synergy': Chapter.objects.create(name='BNI Synergy', location='Dubai'),
             'united': Chapter.objects.create(name='BNI United', location='Dubai'),
         }
+        cls.processors = {
+            chapter_key: ExcelProcessorService(chapter)
+            for chapter_key, chapter in cls.chapters.items()
+        }
+
+        # Process Continental's slip audit once; the extraction tests only read
+        # the rows it creates, which persist for the whole class
+        cls.processed_results = {}
+        slip_files = get_slip_files('continental')
+        if slip_files:
+            cls.processed_results['continental'] = (
+                cls.processors['continental'].process_excel_file(slip_files[0])
+            )
+
+    def get_processed_result(self, chapter_key):
+        """Return the setUpTestData processing result, skipping if there was no file."""
+        result = self.processed_results.get(chapter_key)
+        if result is None:
+            self.skipTest(f"No slip audit files found for {chapter_key}")
+        return result
 
     def test_member_names_file_parsing(self):
         """Test that member names files can be read and parsed correctly."""
         for chapter_key, chapter in self.chapters.items():
-            member_file = MEMBER_NAMES_DIR / f'bni-{chapter_key}.xls'
+            member_file = CHAPTER_MEMBER_FILES[chapter_key]
 
             # Skip if file doesn't exist
             if not member_file.exists():
                 self.skipTest(f"Member names file not found: {member_file}")
 
             # Read and process the member names file
-            processor = ExcelProcessorService(chapter)
+            processor = self.processors[chapter_key]
 
             # This test validates that the file can be read
             # Actual member creation would be done through the upload endpoint
@@ -62,29 +112,17 @@ class ExcelProcessingTestCase(TestCase):
     def test_slip_audit_file_exists(self):
         """Test that slip audit files exist for all chapters."""
         for chapter_key in self.chapters.keys():
-            slip_audit_dir = SLIP_AUDIT_DIR / chapter_key
+            slip_audit_dir = CHAPTER_SLIP_DIRS[chapter_key]
 
             self.assertTrue(slip_audit_dir.exists(), f"Slip audit directory exists for {chapter_key}")
 
             # Check for .xls files in the directory
-            xls_files = list(slip_audit_dir.glob('*.xls'))
+            xls_files = get_slip_files(chapter_key)
             self.assertGreater(len(xls_files), 0, f"At least one slip audit file exists for {chapter_key}")
 
     def test_continental_slip_audit_processing(self):
         """Test processing BNI Continental's slip audit report."""
-        chapter = self.chapters['continental']
-        slip_audit_dir = SLIP_AUDIT_DIR / 'continental'
-
-        # Get the first slip audit file
-        slip_files = list(slip_audit_dir.glob('*.xls'))
-        if not slip_files:
-            self.skipTest("No slip audit files found for Continental")
-
-        slip_file = slip_files[0]
-
-        # Process the file
-        processor = ExcelProcessorService(chapter)
-        result = processor.process_excel_file(slip_file, week_of_date=None)
+        result = self.get_processed_result('continental')
 
         # Validate processing completed
         self.assertIn('success', result)
@@ -108,8 +146,7 @@ class ExcelProcessingTestCase(TestCase):
         results_summary = {}
 
         for chapter_key, chapter in self.chapters.items():
-            slip_audit_dir = SLIP_AUDIT_DIR / chapter_key
-            slip_files = list(slip_audit_dir.glob('*.xls'))
+            slip_files = get_slip_files(chapter_key)
 
             if not slip_files:
                 results_summary[chapter_key] = {'status': 'NO_FILE'}
@@ -117,7 +154,7 @@ class ExcelProcessingTestCase(TestCase):
 
             # Process the first file found
             slip_file = slip_files[0]
-            processor = ExcelProcessorService(chapter)
+            processor = self.processors[chapter_key]
             result = processor.process_excel_file(slip_file)
 
             results_summary[chapter_key] = {
@@ -149,18 +186,10 @@ class ExcelProcessingTestCase(TestCase):
     def test_referral_data_extraction(self):
         """Test that referral data is extracted correctly."""
         chapter = self.chapters['continental']
-        slip_audit_dir = SLIP_AUDIT_DIR / 'continental'
-        slip_files = list(slip_audit_dir.glob('*.xls'))
-
-        if not slip_files:
-            self.skipTest("No slip audit files found")
-
-        # Process file
-        processor = ExcelProcessorService(chapter)
-        result = processor.process_excel_file(slip_files[0])
+        self.get_processed_result('continental')
 
         # Check that referrals were created in database
-        referrals = Referral.objects.filter(giver__chapter=chapter)
+        referrals = Referral.objects.filter(giver__chapter=chapter).select_related('giver', 'receiver')
 
         print(f"\nReferrals extracted: {referrals.count()}")
 
@@ -179,18 +208,10 @@ class ExcelProcessingTestCase(TestCase):
     def test_one_to_one_data_extraction(self):
         """Test that one-to-one meeting data is extracted correctly."""
         chapter = self.chapters['continental']
-        slip_audit_dir = SLIP_AUDIT_DIR / 'continental'
-        slip_files = list(slip_audit_dir.glob('*.xls'))
-
-        if not slip_files:
-            self.skipTest("No slip audit files found")
-
-        # Process file
-        processor = ExcelProcessorService(chapter)
-        result = processor.process_excel_file(slip_files[0])
+        self.get_processed_result('continental')
 
         # Check that one-to-ones were created
-        otos = OneToOne.objects.filter(member1__chapter=chapter)
+        otos = OneToOne.objects.filter(member1__chapter=chapter).select_related('member1', 'member2')
 
         print(f"\nOne-to-Ones extracted: {otos.count()}")
 
@@ -209,18 +230,10 @@ class ExcelProcessingTestCase(TestCase):
     def test_tyfcb_data_extraction(self):
         """Test that TYFCB data is extracted correctly."""
         chapter = self.chapters['continental']
-        slip_audit_dir = SLIP_AUDIT_DIR / 'continental'
-        slip_files = list(slip_audit_dir.glob('*.xls'))
-
-        if not slip_files:
-            self.skipTest("No slip audit files found")
-
-        # Process file
-        processor = ExcelProcessorService(chapter)
-        result = processor.process_excel_file(slip_files[0])
+        self.get_processed_result('continental')
 
         # Check that TYFCBs were created
-        tyfcbs = TYFCB.objects.filter(receiver__chapter=chapter)
+        tyfcbs = TYFCB.objects.filter(receiver__chapter=chapter).select_related('receiver', 'giver')
 
         print(f"\nTYFCBs extracted: {tyfcbs.count()}")
 
@@ -232,7 +245,7 @@ class ExcelProcessingTestCase(TestCase):
             self.assertGreater(first_tyfcb.amount, 0)
 
             # Calculate total TYFCB
-            total_tyfcb = sum(t.amount for t in tyfcbs)
+            total_tyfcb = tyfcbs.aggregate(total=Sum('amount'))['total']
 
             print(f"Sample TYFCB:")
             print(f"  Receiver: {first_tyfcb.receiver.full_name}")
@@ -273,21 +286,18 @@ class ExcelProcessingTestCase(TestCase):
 
     def test_data_integrity_no_duplicates(self):
         """Test that no duplicate referrals are created."""
-        chapter = self.chapters['continental']
-        slip_audit_dir = SLIP_AUDIT_DIR / 'continental'
-        slip_files = list(slip_audit_dir.glob('*.xls'))
+        chapter_key = 'continental'
+        chapter = self.chapters[chapter_key]
+        slip_files = get_slip_files(chapter_key)
 
         if not slip_files:
             self.skipTest("No slip audit files found")
 
-        # Process file twice
-        processor = ExcelProcessorService(chapter)
-        result1 = processor.process_excel_file(slip_files[0])
-        result2 = processor.process_excel_file(slip_files[0])
-
-        # Second processing should handle duplicates gracefully
-        referrals_after_first = Referral.objects.filter(giver__chapter=chapter).count()
-        referrals_after_second = Referral.objects.filter(giver__chapter=chapter).count()
+        # The file was already imported once in setUpTestData; import it again
+        referrals = Referral.objects.filter(giver__chapter=chapter)
+        referrals_after_first = referrals.count()
+        self.processors[chapter_key].process_excel_file(slip_files[0])
+        referrals_after_second = referrals.count()
 
         print(f"\nReferrals after first import: {referrals_after_first}")
         print(f"Referrals after second import: {referrals_after_second}")
@@ -14,8 +14,10 @@ from datetime import date, datetime
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from features.chapters.models import Chapter, Member, MonthlyReport, MemberMonthlyStats
-from features.analytics.models import Referral, OneToOne, TYFCB
+from chapters.models import Chapter
+from members.models import Member
+from reports.models import MonthlyReport, MemberMonthlyStats
+from analytics.models import Referral, OneToOne, TYFCB
 
 
 class ChapterModelTestCase(TestCase):
@@ -45,16 +47,13 @@ class ChapterModelTestCase(TestCase):
         """Test the reverse relationship to members."""
         chapter = Chapter.objects.create(name='BNI Test Chapter')
 
-        Member.objects.create(
-            chapter=chapter,
-            first_name='John',
-            last_name='Smith'
-        )
-        Member.objects.create(
-            chapter=chapter,
-            first_name='Jane',
-            last_name='Doe'
-        )
+        # bulk_create skips Member.save(), so normalized_name is set explicitly
+        Member.objects.bulk_create([
+            Member(chapter=chapter, first_name='John', last_name='Smith',
+                   normalized_name=Member.normalize_name('John Smith')),
+            Member(chapter=chapter, first_name='Jane', last_name='Doe',
+                   normalized_name=Member.normalize_name('Jane Doe')),
+        ])
 
         self.assertEqual(chapter.members.count(), 2)
 
@@ -62,8 +61,9 @@ class ChapterModelTestCase(TestCase):
 class MemberModelTestCase(TestCase):
     """Test the Member model."""
 
-    def setUp(self):
-        self.chapter = Chapter.objects.create(name='BNI Test Chapter')
+    @classmethod
+    def setUpTestData(cls):
+        cls.chapter = Chapter.objects.create(name='BNI Test Chapter')
 
     def test_create_member(self):
         """Test creating a basic member."""
@@ -152,8 +152,9 @@ class MemberModelTestCase(TestCase):
 class MonthlyReportModelTestCase(TestCase):
     """Test the MonthlyReport model."""
 
-    def setUp(self):
-        self.chapter = Chapter.objects.create(name='BNI Test Chapter')
+    @classmethod
+    def setUpTestData(cls):
+        cls.chapter = Chapter.objects.create(name='BNI Test Chapter')
 
     def test_create_monthly_report(self):
         """Test creating a monthly report."""
@@ -228,15 +229,16 @@ class MonthlyReportModelTestCase(TestCase):
 class ReferralModelTestCase(TestCase):
     """Test the Referral model."""
 
-    def setUp(self):
-        self.chapter = Chapter.objects.create(name='BNI Test Chapter')
-        self.giver = Member.objects.create(
-            chapter=self.chapter,
+    @classmethod
+    def setUpTestData(cls):
+        cls.chapter = Chapter.objects.create(name='BNI Test Chapter')
+        cls.giver = Member.objects.create(
+            chapter=cls.chapter,
             first_name='John',
             last_name='Smith'
         )
-        self.receiver = Member.objects.create(
-            chapter=self.chapter,
+        cls.receiver = Member.objects.create(
+            chapter=cls.chapter,
             first_name='Jane',
             last_name='Doe'
         )
@@ -302,15 +304,16 @@ class ReferralModelTestCase(TestCase):
 class OneToOneModelTestCase(TestCase):
     """Test the OneToOne model."""
 
-    def setUp(self):
-        self.chapter = Chapter.objects.create(name='BNI Test Chapter')
-        self.member1 = Member.objects.create(
-            chapter=self.chapter,
+    @classmethod
+    def setUpTestData(cls):
+        cls.chapter = Chapter.objects.create(name='BNI Test Chapter')
+        cls.member1 = Member.objects.create(
+            chapter=cls.chapter,
             first_name='John',
             last_name='Smith'
         )
-        self.member2 = Member.objects.create(
-            chapter=self.chapter,
+        cls.member2 = Member.objects.create(
+            chapter=cls.chapter,
             first_name='Jane',
             last_name='Doe'
         )
@@ -373,15 +376,16 @@ class OneToOneModelTestCase(TestCase):
 class TYFCBModelTestCase(TestCase):
     """Test the TYFCB model."""
 
-    def setUp(self):
-        self.chapter = Chapter.objects.create(name='BNI Test Chapter')
-        self.giver = Member.objects.create(
-            chapter=self.chapter,
+    @classmethod
+    def setUpTestData(cls):
+        cls.chapter = Chapter.objects.create(name='BNI Test Chapter')
+        cls.giver = Member.objects.create(
+            chapter=cls.chapter,
             first_name='John',
             last_name='Smith'
         )
-        self.receiver = Member.objects.create(
-            chapter=self.chapter,
+        cls.receiver = Member.objects.create(
+            chapter=cls.chapter,
             first_name='Jane',
             last_name='Doe'
         )
@@ -452,15 +456,16 @@ class TYFCBModelTestCase(TestCase):
 class MemberMonthlyStatsTestCase(TestCase):
     """Test the MemberMonthlyStats model."""
 
-    def setUp(self):
-        self.chapter = Chapter.objects.create(name='BNI Test Chapter')
-        self.member = Member.objects.create(
-            chapter=self.chapter,
+    @classmethod
+    def setUpTestData(cls):
+        cls.chapter = Chapter.objects.create(name='BNI Test Chapter')
+        cls.member = Member.objects.create(
+            chapter=cls.chapter,
             first_name='John',
             last_name='Smith'
         )
-        self.report = MonthlyReport.objects.create(
-            chapter=self.chapter,
+        cls.report = MonthlyReport.objects.create(
+            chapter=cls.chapter,
             month_year='2025-08'
         )
 